@@ -1,7 +1,211 @@
+import argparse
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from bawang import config
+from bawang.models import EpisodeUpdate
+from bawang.resolver.resolve import default_policy, resolve_links
+from bawang.scraper.episodes import fetch_episodes, refresh_episodes
+from bawang.scraper.search import search_anime
+from bawang.scraper.watch import watch_followed
 from bawang.tui.app import run_app
+from bawang.utils.net import get_client
+from bawang.utils.watchlist import get_watchlist
+
+
+Record = Dict[str, Any]
+
+
+def _inputs(values: List[str]) -> List[str]:
+    if values and values != ["-"]:
+        return values
+    lines = (line.strip() for line in sys.stdin)
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def _run_batch(
+    items: List[str],
+    handler: Callable[[str], List[Record]],
+    workers: int,
+    output: str,
+) -> int:
+    failed = False
+    ordered: List[List[Record]] = [[] for _ in items]
+
+    def run(item: str) -> List[Record]:
+        try:
+            return handler(item)
+        except Exception as exc:  # noqa: BLE001 - report per input and keep going
+            return [{"input": item, "error": str(exc) or exc.__class__.__name__}]
+
+    workers = max(1, min(workers, len(items) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-batch") as pool:
+        futures = {pool.submit(run, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            records = future.result()
+            failed = failed or any("error" in record for record in records)
+            if output == "ndjson":
+                for record in records:
+                    print(json.dumps(record, ensure_ascii=False), flush=True)
+            else:
+                ordered[futures[future]] = records
+    if output == "json":
+        records = [record for group in ordered for record in group]
+        print(json.dumps(records, ensure_ascii=False, indent=2))
+    return 1 if failed else 0
+
+
+def _search(args: argparse.Namespace) -> int:
+    def handle(query: str) -> List[Record]:
+        results = search_anime(
+            client, query, max_pages=args.max_pages, use_catalog=not args.no_catalog
+        )
+        return [dict(asdict(result), query=query) for result in results]
+
+    with get_client() as client:
+        return _run_batch(_inputs(args.queries), handle, args.workers, args.output)
+
+
+def _episodes(args: argparse.Namespace) -> int:
+    def handle(anime_url: str) -> List[Record]:
+        episodes = fetch_episodes(client, anime_url)
+        return [dict(asdict(episode), anime_url=anime_url) for episode in episodes]
+
+    with get_client() as client:
+        return _run_batch(_inputs(args.urls), handle, args.workers, args.output)
+
+
+def _resolve(args: argparse.Namespace) -> int:
+    policy = None if args.all else default_policy()
+
+    def handle(episode_url: str) -> List[Record]:
+        resolved = resolve_links(
+            client,
+            episode_url,
+            budget=args.budget,
+            use_cache=not args.no_cache,
+            policy=policy,
+        )
+        return [
+            dict(asdict(option), episode_url=episode_url, partial=resolved.partial)
+            for option in resolved.options
+        ]
+
+    with get_client() as client:
+        return _run_batch(_inputs(args.urls), handle, args.workers, args.output)
+
+
+def _print_update(update: EpisodeUpdate) -> None:
+    for episode in reversed(update.new):
+        print(f"{update.title}: {episode.title} {episode.url}", flush=True)
+
+
+def _watch(args: argparse.Namespace) -> int:
+    store = get_watchlist()
+    for anime_url in args.remove:
+        if not store.unfollow(anime_url):
+            print(f"Not followed: {anime_url}", file=sys.stderr)
+    for anime_url in args.add:
+        store.follow(anime_url)
+    if args.list:
+        for show in store.followed():
+            print(f"{show.title}\t{len(show.episodes)} episodes\t{show.anime_url}")
+        return 0
+    if not store.followed():
+        print("No followed shows. Add one with: bawang watch --add URL", file=sys.stderr)
+        return 1
+
+    with get_client() as client:
+        for anime_url in args.add:
+            update = refresh_episodes(client, anime_url, store)
+            print(f"Following {update.title} ({len(update.episodes)} episodes)")
+        if args.add or args.remove:
+            return 0
+        try:
+            watch_followed(
+                client,
+                _print_update,
+                interval=args.interval,
+                rounds=1 if args.once else None,
+                store=store,
+            )
+        except KeyboardInterrupt:
+            return 0
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bawang", description="Search and stream anime from Samehadaku."
+    )
+    commands = parser.add_subparsers(dest="command")
+
+    batch = argparse.ArgumentParser(add_help=False)
+    batch.add_argument(
+        "--output",
+        choices=("ndjson", "json"),
+        default="ndjson",
+        help="ndjson streams one record per line, json prints a single array",
+    )
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=config.BATCH_WORKERS,
+        help="inputs processed concurrently",
+    )
+
+    search = commands.add_parser(
+        "search", parents=[batch], help="search titles (queries from args or stdin)"
+    )
+    search.add_argument("queries", nargs="*", metavar="QUERY")
+    search.add_argument("--max-pages", type=int, default=None, help="result pages per query")
+    search.add_argument("--no-catalog", action="store_true", help="skip the local catalog")
+
+    episodes = commands.add_parser(
+        "episodes", parents=[batch], help="list episodes (anime URLs from args or stdin)"
+    )
+    episodes.add_argument("urls", nargs="*", metavar="URL")
+
+    resolve = commands.add_parser(
+        "resolve", parents=[batch], help="resolve streams (episode URLs from args or stdin)"
+    )
+    resolve.add_argument("urls", nargs="*", metavar="URL")
+    resolve.add_argument(
+        "--budget",
+        type=float,
+        default=config.RESOLVE_BUDGET,
+        metavar="SECONDS",
+        help="time budget per episode",
+    )
+    resolve.add_argument("--all", action="store_true", help="do not stop at the first good link")
+    resolve.add_argument("--no-cache", action="store_true", help="ignore cached streams")
+
+    watch = commands.add_parser("watch", help="poll followed shows and report new episodes")
+    watch.add_argument("--add", nargs="+", default=[], metavar="URL", help="follow anime URLs")
+    watch.add_argument(
+        "--remove", nargs="+", default=[], metavar="URL", help="stop following anime URLs"
+    )
+    watch.add_argument("--list", action="store_true", help="list followed shows and exit")
+    watch.add_argument("--once", action="store_true", help="poll a single time and exit")
+    watch.add_argument(
+        "--interval", type=float, default=None, metavar="SECONDS", help="seconds between polls"
+    )
+    return parser
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    handlers = {
+        "search": _search,
+        "episodes": _episodes,
+        "resolve": _resolve,
+        "watch": _watch,
+    }
+    if args.command in handlers:
+        sys.exit(handlers[args.command](args))
     run_app()
 
 
@@ -3,9 +3,22 @@ import shlex
 
 
 BASE_URL = os.getenv("BWN_BASE_URL", "https://v1.samehadaku.how")
+MIRROR_URLS = [BASE_URL] + [
+    url.strip().rstrip("/")
+    for url in os.getenv("BWN_MIRRORS", "").split(",")
+    if url.strip() and url.strip().rstrip("/") != BASE_URL.rstrip("/")
+]
+MIRROR_PROBE_TIMEOUT = float(os.getenv("BWN_MIRROR_PROBE_TIMEOUT", "6.0"))
+MIRROR_REPROBE_INTERVAL = int(os.getenv("BWN_MIRROR_REPROBE_INTERVAL", str(30 * 60)))
 SEARCH_PATH = "/?s={query}"
+SEARCH_PAGE_PATH = "/page/{page}/?s={query}"
+SEARCH_MAX_PAGES = int(os.getenv("BWN_SEARCH_MAX_PAGES", "10"))
+SEARCH_WORKERS = int(os.getenv("BWN_SEARCH_WORKERS", "4"))
 ADMIN_AJAX_PATH = "/wp-admin/admin-ajax.php"
 DEFAULT_TIMEOUT = 20.0
+HTTP_FALLBACK_WORKERS = int(os.getenv("BWN_HTTP_FALLBACK_WORKERS", "4"))
+RESOLVE_WORKERS = int(os.getenv("BWN_RESOLVE_WORKERS", "8"))
+HTML_PARSER = os.getenv("BWN_HTML_PARSER", "auto")
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -27,3 +40,97 @@ MPV_DEFAULT_ARGS = [
     "--demuxer-max-bytes=200M",
 ]
 MPV_EXTRA_ARGS = shlex.split(os.getenv("BWN_MPV_ARGS", ""))
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _default_cache_dir() -> str:
+    base = os.getenv("LOCALAPPDATA") if os.name == "nt" else os.getenv("XDG_CACHE_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bawang")
+
+
+def _default_data_dir() -> str:
+    base = os.getenv("APPDATA") if os.name == "nt" else os.getenv("XDG_DATA_HOME")
+    if not base:
+        base = os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, "bawang")
+
+
+CACHE_DIR = os.getenv("BWN_CACHE_DIR") or _default_cache_dir()
+DATA_DIR = os.getenv("BWN_DATA_DIR") or _default_data_dir()
+HTTP_CACHE_ENABLED = _env_flag("BWN_HTTP_CACHE", True)
+HTTP_CACHE_MAX_BYTES = int(os.getenv("BWN_HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+HTTP_CACHE_TTLS = {
+    "search": 30 * 60,
+    "anime": 15 * 60,
+    "episode": 6 * 60 * 60,
+    "embed": 10 * 60,
+}
+HTTP_CACHE_STALE = {
+    "search": 24 * 60 * 60,
+    "anime": 0,
+    "episode": 24 * 60 * 60,
+    "embed": 0,
+}
+STREAM_CACHE_ENABLED = _env_flag("BWN_STREAM_CACHE", True)
+STREAM_CACHE_DEFAULT_TTL = int(os.getenv("BWN_STREAM_CACHE_TTL", str(10 * 60)))
+STREAM_CACHE_MAX_TTL = 6 * 60 * 60
+STREAM_CACHE_EXPIRY_MARGIN = 5 * 60
+PREFETCH_ENABLED = _env_flag("BWN_PREFETCH", True)
+PREFETCH_WORKERS = int(os.getenv("BWN_PREFETCH_WORKERS", "2"))
+PREFETCH_RESULTS = int(os.getenv("BWN_PREFETCH_RESULTS", "3"))
+PREFETCH_EPISODES = int(os.getenv("BWN_PREFETCH_EPISODES", "2"))
+PROVIDER_HISTORY_ENABLED = _env_flag("BWN_PROVIDER_HISTORY", True)
+PROVIDER_HISTORY_DECAY = 0.8
+PROVIDER_HISTORY_MAX_AGE = 7 * 24 * 60 * 60
+COOKIE_JAR_ENABLED = _env_flag("BWN_COOKIE_JAR", True)
+HTTP2_ENABLED = _env_flag("BWN_HTTP2", False)
+HTTP_MAX_CONNECTIONS = int(os.getenv("BWN_HTTP_MAX_CONNECTIONS", "20"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("BWN_HTTP_MAX_KEEPALIVE", "10"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("BWN_HTTP_KEEPALIVE_EXPIRY", "60.0"))
+PRECONNECT_ENABLED = _env_flag("BWN_PRECONNECT", True)
+PRECONNECT_TIMEOUT = 5.0
+PRECONNECT_ORIGINS = [
+    "https://www.blogger.com",
+    "https://wibufile.com",
+    "https://filedon.co",
+]
+RATE_LIMIT_PER_SECOND = float(os.getenv("BWN_RATE_LIMIT", "4.0"))
+RATE_LIMIT_BURST = int(os.getenv("BWN_RATE_BURST", "8"))
+RATE_LIMIT_HOSTS = {
+    host.strip().lower(): float(rate)
+    for host, _, rate in (
+        item.partition("=") for item in os.getenv("BWN_RATE_LIMIT_HOSTS", "").split(",")
+    )
+    if host.strip() and rate.strip()
+}
+RATE_LIMIT_RETRIES = int(os.getenv("BWN_RATE_LIMIT_RETRIES", "3"))
+RATE_LIMIT_BACKOFF_BASE = 1.0
+RATE_LIMIT_BACKOFF_MAX = 60.0
+RESOLVE_BUDGET = float(os.getenv("BWN_RESOLVE_BUDGET", "30.0"))
+RESOLVE_EARLY_EXIT = _env_flag("BWN_RESOLVE_EARLY_EXIT", True)
+GOOD_ENOUGH_HOSTS = int(os.getenv("BWN_GOOD_ENOUGH_HOSTS", "2"))
+GOOD_ENOUGH_QUALITY = int(os.getenv("BWN_GOOD_ENOUGH_QUALITY", "1080"))
+PROBE_ENABLED = _env_flag("BWN_PROBE", False)
+PROBE_TIMEOUT = float(os.getenv("BWN_PROBE_TIMEOUT", "4.0"))
+PROBE_BYTES = int(os.getenv("BWN_PROBE_BYTES", str(256 * 1024)))
+PROBE_WORKERS = int(os.getenv("BWN_PROBE_WORKERS", "6"))
+PROBE_MIN_THROUGHPUT = float(os.getenv("BWN_PROBE_MIN_THROUGHPUT", str(256 * 1024)))
+PROBE_DROP_DEAD = _env_flag("BWN_PROBE_DROP_DEAD", False)
+HLS_EXPAND = _env_flag("BWN_HLS_EXPAND", True)
+CATALOG_ENABLED = _env_flag("BWN_CATALOG", False)
+CATALOG_PATH = os.getenv("BWN_CATALOG_PATH", "/daftar-anime-2/")
+CATALOG_MAX_AGE = int(os.getenv("BWN_CATALOG_MAX_AGE", str(24 * 60 * 60)))
+CATALOG_MAX_PAGES = int(os.getenv("BWN_CATALOG_MAX_PAGES", "200"))
+CATALOG_MIN_SCORE = float(os.getenv("BWN_CATALOG_MIN_SCORE", "0.5"))
+CATALOG_CONFIDENT_SCORE = float(os.getenv("BWN_CATALOG_CONFIDENT_SCORE", "0.8"))
+WATCH_INTERVAL = int(os.getenv("BWN_WATCH_INTERVAL", str(30 * 60)))
+WATCH_WORKERS = int(os.getenv("BWN_WATCH_WORKERS", "4"))
+BATCH_WORKERS = int(os.getenv("BWN_BATCH_WORKERS", "4"))
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass(frozen=True)
@@ -25,3 +25,28 @@ class VideoLink:
 class QualityOption:
     label: str
     url: str
+    alive: Optional[bool] = None
+    ttfb: Optional[float] = None
+    throughput: Optional[float] = None
+    resolution: Optional[str] = None
+    bandwidth: Optional[int] = None
+
+    @property
+    def height(self) -> Optional[int]:
+        height = (self.resolution or "").partition("x")[2]
+        return int(height) if height.isdigit() else None
+
+
+@dataclass(frozen=True)
+class ResolveResult:
+    options: List[QualityOption] = field(default_factory=list)
+    partial: bool = False
+
+
+@dataclass(frozen=True)
+class EpisodeUpdate:
+    anime_url: str
+    title: str
+    episodes: List[Episode] = field(default_factory=list)
+    new: List[Episode] = field(default_factory=list)
+    changed: bool = False
@@ -0,0 +1,140 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from bawang import config
+from bawang.models import QualityOption
+
+
+LOGGER = logging.getLogger(__name__)
+EXPIRY_PARAMS = ("expire", "expires", "exp")
+
+
+def _url_expiry(url: str) -> Optional[float]:
+    query = parse_qs(urlparse(url).query)
+    for name in EXPIRY_PARAMS:
+        for value in query.get(name, []):
+            if value.isdigit():
+                return float(value)
+    return None
+
+
+def expiry_for(options: List[QualityOption], now: Optional[float] = None) -> float:
+    now = time.time() if now is None else now
+    expiries = [value for value in (_url_expiry(item.url) for item in options) if value]
+    if not expiries:
+        return now + config.STREAM_CACHE_DEFAULT_TTL
+    expires_at = min(expiries) - config.STREAM_CACHE_EXPIRY_MARGIN
+    return min(expires_at, now + config.STREAM_CACHE_MAX_TTL)
+
+
+class StreamCache:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._memory: Dict[str, Tuple[float, List[QualityOption], bool]] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS streams ("
+                    "episode_url TEXT PRIMARY KEY, options TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, complete INTEGER NOT NULL DEFAULT 1)"
+                )
+                self._conn.execute("DELETE FROM streams WHERE expires_at <= ?", (time.time(),))
+                self._conn.commit()
+            except sqlite3.Error as exc:
+                LOGGER.debug("Stream cache disk store unavailable: %s", exc)
+                self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def get(
+        self, episode_url: str, complete_only: bool = False
+    ) -> Optional[List[QualityOption]]:
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(episode_url)
+            if cached and cached[0] > now:
+                if complete_only and not cached[2]:
+                    return None
+                return list(cached[1])
+            self._memory.pop(episode_url, None)
+            if not self._conn:
+                return None
+            row = self._conn.execute(
+                "SELECT options, expires_at, complete FROM streams WHERE episode_url = ?",
+                (episode_url,),
+            ).fetchone()
+            if row is None:
+                return None
+            payload, expires_at, complete = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM streams WHERE episode_url = ?", (episode_url,))
+                self._conn.commit()
+                return None
+            try:
+                options = [QualityOption(**item) for item in json.loads(payload)]
+            except (TypeError, ValueError):
+                return None
+            self._memory[episode_url] = (expires_at, options, bool(complete))
+            if complete_only and not complete:
+                return None
+            return list(options)
+
+    def put(
+        self, episode_url: str, options: List[QualityOption], complete: bool = True
+    ) -> None:
+        if not options:
+            return
+        expires_at = expiry_for(options)
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._memory[episode_url] = (expires_at, list(options), complete)
+            if not self._conn:
+                return
+            payload = json.dumps([asdict(item) for item in options])
+            self._conn.execute(
+                "INSERT OR REPLACE INTO streams (episode_url, options, expires_at, complete) "
+                "VALUES (?, ?, ?, ?)",
+                (episode_url, payload, expires_at, int(complete)),
+            )
+            self._conn.commit()
+
+    def discard(self, episode_url: str) -> None:
+        with self._lock:
+            self._memory.pop(episode_url, None)
+            if self._conn:
+                self._conn.execute("DELETE FROM streams WHERE episode_url = ?", (episode_url,))
+                self._conn.commit()
+
+
+_STREAM_CACHE: Optional[StreamCache] = None
+_STREAM_CACHE_LOCK = threading.Lock()
+
+
+def get_stream_cache() -> Optional[StreamCache]:
+    global _STREAM_CACHE
+    if not config.STREAM_CACHE_ENABLED:
+        return None
+    with _STREAM_CACHE_LOCK:
+        if _STREAM_CACHE is None:
+            path = None
+            try:
+                os.makedirs(config.CACHE_DIR, exist_ok=True)
+                path = os.path.join(config.CACHE_DIR, "streams.sqlite3")
+            except OSError as exc:
+                LOGGER.debug("Stream cache directory unavailable: %s", exc)
+            _STREAM_CACHE = StreamCache(path)
+        return _STREAM_CACHE
@@ -1,52 +1,116 @@
+import html as htmlcodec
 import re
-from typing import Iterable, List
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, TypeVar, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bawang.utils.dom import HtmlNode, parse_html
 
 
-MEDIA_REGEX = re.compile(r"(https?://[^\\s'\"<>]+?\\.(?:m3u8|mp4)(?:\\?[^\\s'\"<>]+)?)")
-PROTOCOL_RELATIVE = re.compile(r"(//[^\\s'\"<>]+?\\.(?:m3u8|mp4)(?:\\?[^\\s'\"<>]+)?)")
+QUALITY_REGEX = re.compile(r"\b(360|480|720|1080)p\b", re.IGNORECASE)
+URL_CHAR = r"""(?:(?![,:]\\?/\\?/)[^\s'"<>])"""
+MEDIA_URL_REGEX = re.compile(rf"""/\\?/{URL_CHAR}+?\.(?:m3u8|mp4)(?:\?{URL_CHAR}*)?""")
+SCHEME_REGEX = re.compile(r"https?:\\?$")
+HINT_WINDOW = 120
 
 
-def _unique(values: Iterable[str]) -> List[str]:
+@dataclass(frozen=True)
+class MediaMatch:
+    url: str
+    quality: Optional[str] = None
+
+
+class ParsedDocument:
+    def __init__(self, html: str) -> None:
+        self.html = html
+        self._soup: Optional[HtmlNode] = None
+
+    @property
+    def soup(self) -> HtmlNode:
+        if self._soup is None:
+            self._soup = parse_html(self.html)
+        return self._soup
+
+
+def as_document(html: Union[str, ParsedDocument]) -> ParsedDocument:
+    if isinstance(html, ParsedDocument):
+        return html
+    return ParsedDocument(html)
+
+
+T = TypeVar("T")
+
+
+def _unique(values: Iterable[T], key=None) -> Iterator[T]:
     seen = set()
-    result = []
     for value in values:
-        if value in seen:
+        marker = key(value) if key else value
+        if marker in seen:
             continue
-        seen.add(value)
-        result.append(value)
-    return result
+        seen.add(marker)
+        yield value
 
 
-def extract_media_urls_from_html(html: str, base_url: str) -> List[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    candidates: List[str] = []
+def unescape_url(url: str) -> str:
+    url = url.replace("\\/", "/").replace("\\u0026", "&").replace("\\u003d", "=")
+    url = htmlcodec.unescape(url.rstrip("\\"))
+    return url.split('"')[0].split("'")[0]
 
-    for source in soup.select("source[src]"):
-        candidates.append(source.get("src", ""))
 
-    for video in soup.select("video[src]"):
-        candidates.append(video.get("src", ""))
+def _absolute(url: str, base_url: str) -> str:
+    if url.startswith("//"):
+        return "https:" + url
+    if url.startswith("http://") or url.startswith("https://"):
+        return url
+    return urljoin(base_url, url)
 
-    for iframe in soup.select("iframe[src]"):
-        candidates.append(iframe.get("src", ""))
 
-    text = soup.get_text(" ", strip=True)
-    candidates.extend(MEDIA_REGEX.findall(html))
-    candidates.extend(PROTOCOL_RELATIVE.findall(html))
-    candidates.extend(MEDIA_REGEX.findall(text))
+def _quality_of(url: str) -> Optional[str]:
+    match = QUALITY_REGEX.search(url)
+    return f"{match.group(1)}p" if match else None
 
-    normalized: List[str] = []
-    for url in candidates:
-        if not url:
-            continue
-        if url.startswith("//"):
-            url = "https:" + url
-        if url.startswith("http://") or url.startswith("https://"):
-            normalized.append(url)
-        else:
-            normalized.append(urljoin(base_url, url))
-
-    return _unique([url for url in normalized if ".mp4" in url or ".m3u8" in url])
+
+def scan_media(text: str, base_url: str, window: int = HINT_WINDOW) -> Iterator[MediaMatch]:
+    matches = MEDIA_URL_REGEX.finditer(text)
+    current = next(matches, None)
+    consumed = 0
+    while current:
+        following = next(matches, None)
+        scheme = SCHEME_REGEX.search(text, max(0, current.start() - 7), current.start())
+        raw = (scheme.group() if scheme else "") + current.group()
+        url = _absolute(unescape_url(raw), base_url)
+        quality = _quality_of(url)
+        if not quality:
+            start = max(consumed, current.start() - window)
+            before = QUALITY_REGEX.findall(text, start, current.start())
+            quality = f"{before[-1]}p" if before else None
+        consumed = current.end()
+        if not quality:
+            limit = min(current.end() + window, following.start() if following else len(text))
+            after = QUALITY_REGEX.search(text, current.end(), limit)
+            if after:
+                quality = f"{after.group(1)}p"
+                consumed = after.end()
+        yield MediaMatch(url, quality)
+        current = following
+
+
+def extract_media_from_html(
+    html: Union[str, ParsedDocument], base_url: str
+) -> List[MediaMatch]:
+    doc = as_document(html)
+
+    def candidates() -> Iterator[MediaMatch]:
+        yield from scan_media(doc.html, base_url)
+        for node in doc.soup.select("source[src], video[src], iframe[src]"):
+            url = _absolute(node.get("src") or "", base_url)
+            if ".mp4" in url or ".m3u8" in url:
+                yield MediaMatch(url, _quality_of(url))
+
+    return list(_unique(candidates(), key=lambda item: item.url))
+
+
+def extract_media_urls_from_html(
+    html: Union[str, ParsedDocument], base_url: str
+) -> List[str]:
+    return [item.url for item in extract_media_from_html(html, base_url)]
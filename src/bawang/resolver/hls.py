@@ -0,0 +1,65 @@
+import re
+from typing import Dict, List
+from urllib.parse import urljoin, urlparse
+
+from bawang.models import QualityOption
+from bawang.utils.net import fetch_text
+
+
+STREAM_INF = "#EXT-X-STREAM-INF:"
+ATTRIBUTE_REGEX = re.compile(r'([A-Z0-9-]+)=("[^"]*"|[^,]*)')
+
+
+def is_hls(url: str) -> bool:
+    return urlparse(url).path.lower().endswith(".m3u8")
+
+
+def parse_attributes(value: str) -> Dict[str, str]:
+    return {name: raw.strip('"') for name, raw in ATTRIBUTE_REGEX.findall(value)}
+
+
+def _variant_label(resolution: str, bandwidth: int) -> str:
+    height = resolution.partition("x")[2]
+    if height.isdigit():
+        return f"{height}p"
+    if bandwidth:
+        return f"{bandwidth // 1000} kbps"
+    return "auto"
+
+
+def parse_master_playlist(text: str, base_url: str) -> List[QualityOption]:
+    variants: List[QualityOption] = []
+    seen = set()
+    pending = None
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith(STREAM_INF):
+            pending = parse_attributes(line[len(STREAM_INF):])
+            continue
+        if not line or line.startswith("#") or pending is None:
+            continue
+        url = urljoin(base_url, line)
+        bandwidth = pending.get("AVERAGE-BANDWIDTH") or pending.get("BANDWIDTH") or ""
+        bandwidth = int(bandwidth) if bandwidth.isdigit() else 0
+        resolution = pending.get("RESOLUTION") or ""
+        pending = None
+        if url in seen:
+            continue
+        seen.add(url)
+        variants.append(
+            QualityOption(
+                label=_variant_label(resolution, bandwidth),
+                url=url,
+                resolution=resolution or None,
+                bandwidth=bandwidth or None,
+            )
+        )
+    return variants
+
+
+def variant_options(client, url: str, referer: str) -> List[QualityOption]:
+    try:
+        playlist = fetch_text(client, url, referer=referer)
+    except Exception:
+        return []
+    return parse_master_playlist(playlist, url)
@@ -1,7 +1,90 @@
-from typing import List
+import logging
+import threading
+from importlib.metadata import entry_points
+from typing import List, Optional, Union
 
-from bawang.resolver.heuristics import extract_media_urls_from_html
+from bawang.resolver.heuristics import ParsedDocument, extract_media_urls_from_html
+from bawang.resolver.hosts import blogger, filedon, mega, wibufile
+from bawang.resolver.hosts.base import HostPlugin
+from bawang.utils.net import fetch_text
 
 
-def resolve_embed_html(html: str, base_url: str) -> List[str]:
+LOGGER = logging.getLogger(__name__)
+ENTRY_POINT_GROUP = "bawang.hosts"
+BUILTIN_HOSTS = (blogger.PLUGIN, wibufile.PLUGIN, filedon.PLUGIN, mega.PLUGIN)
+
+_EXTRA_HOSTS: List[HostPlugin] = []
+_ENTRY_POINTS_LOADED = False
+_HOSTS_LOCK = threading.Lock()
+
+
+def register_host(plugin: HostPlugin) -> HostPlugin:
+    with _HOSTS_LOCK:
+        _EXTRA_HOSTS.insert(0, plugin)
+    return plugin
+
+
+def _load_entry_points() -> List[HostPlugin]:
+    plugins: List[HostPlugin] = []
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded = entry_point.load()
+        except Exception as exc:  # noqa: BLE001 - broken third-party plugin
+            LOGGER.warning("Failed to load host plugin %s: %s", entry_point.name, exc)
+            continue
+        if callable(loaded) and not isinstance(loaded, HostPlugin):
+            loaded = loaded()
+        if isinstance(loaded, HostPlugin):
+            plugins.append(loaded)
+        else:
+            LOGGER.warning("Host plugin %s is not a HostPlugin", entry_point.name)
+    return plugins
+
+
+def host_plugins() -> List[HostPlugin]:
+    global _ENTRY_POINTS_LOADED
+    with _HOSTS_LOCK:
+        if not _ENTRY_POINTS_LOADED:
+            _ENTRY_POINTS_LOADED = True
+            _EXTRA_HOSTS.extend(_load_entry_points())
+        return _EXTRA_HOSTS + list(BUILTIN_HOSTS)
+
+
+def find_host(url: str) -> Optional[HostPlugin]:
+    for plugin in host_plugins():
+        if plugin.matches(url):
+            return plugin
+    return None
+
+
+def resolve_embed_html(html: Union[str, ParsedDocument], base_url: str) -> List[str]:
+    plugin = find_host(base_url)
+    if plugin and plugin.extract:
+        raw = html.html if isinstance(html, ParsedDocument) else html
+        try:
+            urls = plugin.extract(raw, base_url)
+        except Exception as exc:  # noqa: BLE001 - fall back to the generic scan
+            LOGGER.warning("Host plugin %s failed on %s: %s", plugin.name, base_url, exc)
+            urls = None
+        if urls:
+            return urls
     return extract_media_urls_from_html(html, base_url)
+
+
+def resolve_embed(client, url: str, referer: str) -> List[str]:
+    if ".mp4" in url or ".m3u8" in url:
+        return [url]
+    plugin = find_host(url)
+    if plugin and plugin.from_url:
+        try:
+            urls = plugin.from_url(url)
+        except Exception as exc:  # noqa: BLE001 - fetch the embed page instead
+            LOGGER.warning("Host plugin %s failed on %s: %s", plugin.name, url, exc)
+            urls = None
+        if urls is not None:
+            return urls
+    try:
+        html = fetch_text(client, url, referer=referer)
+    except Exception:
+        return []
+    return resolve_embed_html(html, url)
@@ -0,0 +1,36 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+
+QUOTED_MEDIA_REGEX = re.compile(
+    r"""["'](?P<url>[^"'\s<>]+?\.(?:m3u8|mp4)(?:\?[^"'\s<>]*)?)["']"""
+)
+
+UrlResolver = Callable[[str], Optional[List[str]]]
+HtmlExtractor = Callable[[str, str], List[str]]
+
+
+@dataclass(frozen=True)
+class HostPlugin:
+    name: str
+    domains: Tuple[str, ...]
+    from_url: Optional[UrlResolver] = None
+    extract: Optional[HtmlExtractor] = None
+
+    def matches(self, url: str) -> bool:
+        netloc = urlparse(url).netloc.lower().split(":")[0]
+        return any(netloc == domain or netloc.endswith(f".{domain}") for domain in self.domains)
+
+
+def quoted_media_urls(html: str, base_url: str) -> List[str]:
+    urls: List[str] = []
+    for match in QUOTED_MEDIA_REGEX.finditer(html):
+        url = match.group("url").replace("\\/", "/")
+        if url.startswith("//"):
+            url = "https:" + url
+        url = urljoin(base_url, url)
+        if url not in urls:
+            urls.append(url)
+    return urls
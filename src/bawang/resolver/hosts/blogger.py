@@ -0,0 +1,38 @@
+import json
+import re
+from typing import List
+
+from bawang.resolver.heuristics import unescape_url
+from bawang.resolver.hosts.base import HostPlugin
+
+
+PLAY_URL_REGEX = re.compile(r'"play_url"\s*:\s*"(https?:[^"]+)"')
+
+
+def extract_streams(html: str, base_url: str) -> List[str]:
+    urls: List[str] = []
+    marker = "VIDEO_CONFIG"
+    idx = html.find(marker)
+    if idx != -1:
+        start = html.find("{", idx)
+        end = html.find("</script>", start)
+        if start != -1 and end != -1:
+            payload = html[start:end]
+            end_brace = payload.rfind("}")
+            if end_brace != -1:
+                payload = payload[: end_brace + 1]
+                try:
+                    data = json.loads(payload)
+                    for stream in data.get("streams", []) or []:
+                        play_url = stream.get("play_url")
+                        if play_url:
+                            urls.append(play_url)
+                except json.JSONDecodeError:
+                    urls = []
+    if not urls:
+        for play_url in PLAY_URL_REGEX.findall(html):
+            urls.append(unescape_url(play_url))
+    return urls
+
+
+PLUGIN = HostPlugin(name="blogger", domains=("blogger.com",), extract=extract_streams)
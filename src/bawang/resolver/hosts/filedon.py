@@ -0,0 +1,4 @@
+from bawang.resolver.hosts.base import HostPlugin, quoted_media_urls
+
+
+PLUGIN = HostPlugin(name="filedon", domains=("filedon.co",), extract=quoted_media_urls)
@@ -0,0 +1,10 @@
+from typing import List, Optional
+
+from bawang.resolver.hosts.base import HostPlugin
+
+
+def skip_fetch(url: str) -> Optional[List[str]]:
+    return []
+
+
+PLUGIN = HostPlugin(name="mega", domains=("mega.nz", "mega.co.nz"), from_url=skip_fetch)
@@ -0,0 +1,18 @@
+import re
+from typing import List
+from urllib.parse import urljoin
+
+from bawang.resolver.hosts.base import HostPlugin, quoted_media_urls
+
+
+PLAYER_SOURCE_REGEX = re.compile(
+    r"""(?:\bsrc|\bfile)\s*[:=]\s*["']([^"']+\.(?:mp4|m3u8)(?:\?[^"']*)?)["']"""
+)
+
+
+def extract_sources(html: str, base_url: str) -> List[str]:
+    urls = [urljoin(base_url, url) for url in PLAYER_SOURCE_REGEX.findall(html)]
+    return urls or quoted_media_urls(html, base_url)
+
+
+PLUGIN = HostPlugin(name="wibufile", domains=("wibufile.com",), extract=extract_sources)
@@ -0,0 +1,82 @@
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import replace
+from typing import List, Optional
+
+from bawang import config
+from bawang.models import QualityOption
+from bawang.resolver.resolve import option_rank
+
+
+LOGGER = logging.getLogger(__name__)
+WAIT_MARGIN = 1.0
+
+
+def is_slow(option: QualityOption) -> bool:
+    return (
+        option.throughput is not None and option.throughput < config.PROBE_MIN_THROUGHPUT
+    )
+
+
+def _tier(option: QualityOption) -> int:
+    if option.alive is False:
+        return 3
+    if is_slow(option):
+        return 2
+    if option.alive is None:
+        return 1
+    return 0
+
+
+def _probe_key(option: QualityOption):
+    host_score, quality, bandwidth = option_rank(option)
+    return _tier(option), -host_score, -quality, -bandwidth, -(option.throughput or 0.0)
+
+
+def probe_option(
+    client, option: QualityOption, timeout: Optional[float] = None
+) -> QualityOption:
+    try:
+        result = client.probe_stream(option.url, timeout=timeout)
+    except Exception as exc:  # noqa: BLE001 - unreachable or stalled stream
+        LOGGER.debug("Probe of %s failed: %s", option.url, exc)
+        return replace(option, alive=False)
+    return replace(
+        option, alive=result.alive, ttfb=result.ttfb, throughput=result.throughput
+    )
+
+
+def rank_probed(options: List[QualityOption]) -> List[QualityOption]:
+    ranked = sorted(options, key=_probe_key)
+    if config.PROBE_DROP_DEAD:
+        alive = [item for item in ranked if item.alive is not False]
+        if alive:
+            return alive
+    return ranked
+
+
+def probe_options(
+    client,
+    options: List[QualityOption],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[QualityOption]:
+    if not options:
+        return []
+    timeout = timeout or config.PROBE_TIMEOUT
+    workers = max(1, min(workers or config.PROBE_WORKERS, len(options)))
+    probed = list(options)
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-probe")
+    try:
+        futures = {
+            pool.submit(probe_option, client, option, timeout): index
+            for index, option in enumerate(options)
+        }
+        rounds = math.ceil(len(options) / workers)
+        done, _ = wait(futures, timeout=timeout * rounds + WAIT_MARGIN)
+        for future in done:
+            probed[futures[future]] = future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return rank_probed(probed)
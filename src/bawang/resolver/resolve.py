@@ -1,23 +1,27 @@
 import base64
-import json
-import re
-from typing import Dict, List, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from bawang import config
-from bawang.models import QualityOption
-from bawang.resolver.heuristics import extract_media_urls_from_html
-from bawang.resolver.hosts import resolve_embed_html
+from bawang.models import QualityOption, ResolveResult
+from bawang.resolver.cache import get_stream_cache
+from bawang.resolver.heuristics import (
+    QUALITY_REGEX,
+    ParsedDocument,
+    extract_media_from_html,
+    extract_media_urls_from_html,
+)
+from bawang.resolver.hls import is_hls, variant_options
+from bawang.resolver.hosts import resolve_embed
+from bawang.utils.deadline import Deadline, deadline_scope
 from bawang.utils.net import fetch_text, post_text
 from bawang.utils.text import clean_whitespace
 
 
-QUALITY_REGEX = re.compile(r"\\b(360|480|720|1080)p\\b", re.IGNORECASE)
-
-
 def _quality_from_text(text: str) -> Optional[str]:
     match = QUALITY_REGEX.search(text)
     if not match:
@@ -33,6 +37,10 @@ def _quality_rank(label: str, url: str) -> int:
     return 0
 
 
+def _option_quality(option: QualityOption) -> int:
+    return option.height or _quality_rank(option.label, option.url)
+
+
 def _host_score(url: str) -> int:
     netloc = urlparse(url).netloc.lower()
     for idx, host in enumerate(config.PREFERRED_HOSTS):
@@ -41,6 +49,31 @@ def _host_score(url: str) -> int:
     return 0
 
 
+@dataclass(frozen=True)
+class ResolvePolicy:
+    min_host_score: int
+    min_quality: int
+
+    def satisfied_by(self, option: QualityOption) -> bool:
+        return (
+            _host_score(option.url) >= self.min_host_score
+            and _option_quality(option) >= self.min_quality
+        )
+
+
+def default_policy() -> Optional[ResolvePolicy]:
+    if not config.RESOLVE_EARLY_EXIT:
+        return None
+    return ResolvePolicy(
+        min_host_score=len(config.PREFERRED_HOSTS) - config.GOOD_ENOUGH_HOSTS + 1,
+        min_quality=config.GOOD_ENOUGH_QUALITY,
+    )
+
+
+def _good_enough(policy: Optional[ResolvePolicy], options: List[QualityOption]) -> bool:
+    return policy is not None and any(policy.satisfied_by(item) for item in options)
+
+
 def _maybe_decode_url(value: str) -> str:
     if value.startswith("http://") or value.startswith("https://"):
         return value
@@ -55,11 +88,20 @@ def _maybe_decode_url(value: str) -> str:
     return value
 
 
-def _add_option(options: List[QualityOption], seen: set, label: str, url: str) -> None:
-    if not url or url in seen:
+def _add_option(options: List[QualityOption], seen: set, option: QualityOption) -> None:
+    if not option.url or option.url in seen:
         return
-    options.append(QualityOption(label=label, url=url))
-    seen.add(url)
+    options.append(option)
+    seen.add(option.url)
+
+
+def _options_for(client, label: str, urls: List[str], referer: str) -> List[QualityOption]:
+    found: List[QualityOption] = []
+    for url in urls:
+        if config.HLS_EXPAND and is_hls(url):
+            found.extend(variant_options(client, url, referer))
+        found.append(QualityOption(label=label, url=url))
+    return found
 
 
 def _extract_player_options(soup) -> List[Dict[str, str]]:
@@ -77,77 +119,110 @@ def _extract_player_options(soup) -> List[Dict[str, str]]:
     return options
 
 
-def _extract_blogger_streams(html: str) -> List[str]:
-    urls: List[str] = []
-    marker = "VIDEO_CONFIG"
-    idx = html.find(marker)
-    if idx != -1:
-        start = html.find("{", idx)
-        end = html.find("</script>", start)
-        if start != -1 and end != -1:
-            payload = html[start:end]
-            end_brace = payload.rfind("}")
-            if end_brace != -1:
-                payload = payload[: end_brace + 1]
-                try:
-                    data = json.loads(payload)
-                    for stream in data.get("streams", []) or []:
-                        play_url = stream.get("play_url")
-                        if play_url:
-                            urls.append(play_url)
-                except json.JSONDecodeError:
-                    urls = []
-    if not urls:
-        for play_url in re.findall(r'\"play_url\"\\s*:\\s*\"(https?://[^\\\"]+)\"', html):
-            urls.append(play_url)
+def _media_from_html(client, html: str, base_url: str, referer: str) -> List[str]:
+    doc = ParsedDocument(html)
+    urls = list(extract_media_urls_from_html(doc, base_url))
+    for iframe in doc.soup.select("iframe[src]"):
+        src = iframe.get("src") or ""
+        if not src:
+            continue
+        src = urljoin(base_url, src)
+        urls.extend(resolve_embed(client, src, referer=referer))
     return urls
 
 
-def _resolve_iframe_src(client, iframe_url: str, referer: str) -> List[str]:
-    if ".mp4" in iframe_url or ".m3u8" in iframe_url:
-        return [iframe_url]
-    if "blogger.com/video.g" in iframe_url:
-        try:
-            html = fetch_text(client, iframe_url, referer=referer)
-        except Exception:
-            return []
-        return _extract_blogger_streams(html)
+def _resolve_embed(client, candidate: str, referer: str) -> List[QualityOption]:
+    return _options_for(client, "auto", resolve_embed(client, candidate, referer), candidate)
+
+
+def _resolve_player_option(
+    client, ajax_url: str, option: Dict[str, str], referer: str
+) -> List[QualityOption]:
+    payload = {
+        "action": "player_ajax",
+        "post": option["post"],
+        "nume": option["nume"],
+        "type": option["type"],
+    }
     try:
-        html = fetch_text(client, iframe_url, referer=referer)
+        response_html = post_text(client, ajax_url, data=payload, referer=referer)
     except Exception:
         return []
-    return extract_media_urls_from_html(html, iframe_url)
+    label = option["label"] or "auto"
+    media_urls = _media_from_html(client, response_html, referer, referer=referer)
+    return _options_for(client, label, media_urls, referer)
 
 
-def _add_from_html(
-    client,
-    html: str,
-    base_url: str,
-    label: str,
-    options: List[QualityOption],
-    seen: set,
-    referer: str,
-) -> None:
-    for media_url in extract_media_urls_from_html(html, base_url):
-        _add_option(options, seen, label, media_url)
-    soup = BeautifulSoup(html, "html.parser")
-    for iframe in soup.select("iframe[src]"):
-        src = iframe.get("src") or ""
-        if not src:
-            continue
-        src = urljoin(base_url, src)
-        for media_url in _resolve_iframe_src(client, src, referer=referer):
-            _add_option(options, seen, label, media_url)
+Branch = Callable[[], List[QualityOption]]
+CANCEL_POLL = 0.2
+
+
+class _Progress:
+    def __init__(self) -> None:
+        self.partial = False
+        self.stopped_early = False
+
+
+def _scoped(deadline: Deadline, func: Callable, *args) -> Callable:
+    def run():
+        with deadline_scope(deadline):
+            return func(*args)
 
+    return run
 
-def resolve_video_links(client, episode_url: str) -> List[QualityOption]:
-    html = fetch_text(client, episode_url)
-    soup = BeautifulSoup(html, "html.parser")
+
+def _wait_slice(deadline: Deadline) -> float:
+    remaining = deadline.remaining()
+    return CANCEL_POLL if remaining is None else min(remaining, CANCEL_POLL)
+
+
+def _iter_branches(
+    branches: List[Branch], workers: int, deadline: Deadline, progress: _Progress
+) -> Iterator[Tuple[int, List[QualityOption]]]:
+    if not branches:
+        return
+    workers = max(1, min(workers, len(branches)))
+    if workers == 1:
+        for index, branch in enumerate(branches):
+            if deadline.expired():
+                break
+            try:
+                found = _scoped(deadline, branch)()
+            except Exception:
+                found = []
+            yield index, found
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-resolve")
+        futures = {
+            pool.submit(_scoped(deadline, branch)): index
+            for index, branch in enumerate(branches)
+        }
+        pending = set(futures)
+        try:
+            while pending and not deadline.expired():
+                done, pending = wait(
+                    pending, timeout=_wait_slice(deadline), return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    try:
+                        found = future.result()
+                    except Exception:
+                        found = []
+                    yield futures[future], found
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    if deadline.expired():
+        progress.partial = True
+
+
+def _plan(client, episode_url: str) -> Tuple[List[QualityOption], set, List[Branch]]:
+    doc = ParsedDocument(fetch_text(client, episode_url))
+    soup = doc.soup
     options: List[QualityOption] = []
     seen = set()
 
-    for media_url in extract_media_urls_from_html(html, episode_url):
-        _add_option(options, seen, "auto", media_url)
+    for media in extract_media_from_html(doc, episode_url):
+        _add_option(options, seen, QualityOption(label=media.quality or "auto", url=media.url))
 
     for anchor in soup.select("a"):
         text = clean_whitespace(anchor.get_text() or "")
@@ -157,7 +232,7 @@ def resolve_video_links(client, episode_url: str) -> List[QualityOption]:
         href = urljoin(episode_url, href)
         quality = _quality_from_text(text) or _quality_from_text(href) or "auto"
         if ".mp4" in href or ".m3u8" in href:
-            _add_option(options, seen, quality, href)
+            _add_option(options, seen, QualityOption(label=quality, url=href))
 
     embed_candidates: List[str] = []
     for tag in soup.select("[data-video], [data-embed], [data-src], [data-url], iframe[src]"):
@@ -183,43 +258,180 @@ def resolve_video_links(client, episode_url: str) -> List[QualityOption]:
         if href.startswith("http://") or href.startswith("https://"):
             embed_candidates.append(href)
 
+    branches: List[Branch] = []
+    if config.HLS_EXPAND:
+        for option in options:
+            if is_hls(option.url):
+                branches.append(
+                    lambda url=option.url: variant_options(client, url, episode_url)
+                )
+    queued = set()
     for candidate in embed_candidates[:10]:
-        if candidate in seen:
+        if candidate in seen or candidate in queued:
             continue
-        try:
-            embed_html = fetch_text(client, candidate, referer=episode_url)
-        except Exception:
-            continue
-        for media_url in resolve_embed_html(embed_html, candidate):
-            _add_option(options, seen, "auto", media_url)
+        queued.add(candidate)
+        branches.append(
+            lambda candidate=candidate: _resolve_embed(client, candidate, episode_url)
+        )
 
     player_options = _extract_player_options(soup)
     if player_options:
         ajax_url = urljoin(episode_url, config.ADMIN_AJAX_PATH)
         for option in player_options:
-            payload = {
-                "action": "player_ajax",
-                "post": option["post"],
-                "nume": option["nume"],
-                "type": option["type"],
-            }
-            try:
-                response_html = post_text(client, ajax_url, data=payload, referer=episode_url)
-            except Exception:
-                continue
-            label = option["label"]
-            _add_from_html(
-                client,
-                response_html,
-                episode_url,
-                label or "auto",
-                options,
-                seen,
-                referer=episode_url,
+            branches.append(
+                lambda option=option: _resolve_player_option(
+                    client, ajax_url, option, episode_url
+                )
             )
+    return options, seen, branches
+
+
+def option_rank(option: QualityOption) -> Tuple[int, int, int]:
+    return _host_score(option.url), _option_quality(option), option.bandwidth or 0
+
+
+def sort_options(options: List[QualityOption]) -> None:
+    options.sort(key=option_rank, reverse=True)
+
+
+def resolve_links(
+    client,
+    episode_url: str,
+    budget: Optional[float] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    policy: Optional[ResolvePolicy] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ResolveResult:
+    cache = get_stream_cache() if use_cache else None
+    if cache:
+        cached = cache.get(episode_url, complete_only=policy is None)
+        if cached:
+            return ResolveResult(options=cached)
+
+    deadline = Deadline(budget, cancel)
+    options, seen, branches = _scoped(deadline, _plan, client, episode_url)()
+    if workers is None:
+        workers = config.RESOLVE_WORKERS
+    progress = _Progress()
+    if branches and _good_enough(policy, options):
+        progress.stopped_early = True
+        branches = []
+    results: List[List[QualityOption]] = [[] for _ in branches]
+    branch_results = _iter_branches(branches, workers, deadline, progress)
+    try:
+        for index, found in branch_results:
+            results[index] = found
+            if _good_enough(policy, found):
+                progress.stopped_early = True
+                break
+    finally:
+        branch_results.close()
+        deadline.cancel()
+
+    for found in results:
+        for option in found:
+            _add_option(options, seen, option)
+
+    sort_options(options)
+    if cache and not progress.partial:
+        cache.put(episode_url, options, complete=not progress.stopped_early)
+    return ResolveResult(options=options, partial=progress.partial)
+
+
+def resolve_video_links(
+    client,
+    episode_url: str,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    budget: Optional[float] = None,
+    policy: Optional[ResolvePolicy] = None,
+) -> List[QualityOption]:
+    return resolve_links(
+        client,
+        episode_url,
+        budget=budget,
+        workers=workers,
+        use_cache=use_cache,
+        policy=policy,
+    ).options
+
+
+class LinkStream:
+    def __init__(
+        self,
+        client,
+        episode_url: str,
+        budget: Optional[float] = None,
+        workers: Optional[int] = None,
+        use_cache: bool = True,
+        policy: Optional[ResolvePolicy] = None,
+    ) -> None:
+        self.partial = False
+        self._client = client
+        self._episode_url = episode_url
+        self._budget = budget
+        self._workers = workers if workers is not None else config.RESOLVE_WORKERS
+        self._use_cache = use_cache
+        self._policy = policy
+        self._iterator = self._generate()
+
+    def __iter__(self) -> Iterator[QualityOption]:
+        return self._iterator
 
-    options.sort(
-        key=lambda item: (_host_score(item.url), _quality_rank(item.label, item.url)),
-        reverse=True,
+    def close(self) -> None:
+        self._iterator.close()
+
+    def _generate(self) -> Iterator[QualityOption]:
+        cache = get_stream_cache() if self._use_cache else None
+        if cache:
+            cached = cache.get(self._episode_url, complete_only=self._policy is None)
+            if cached:
+                yield from cached
+                return
+
+        deadline = Deadline(self._budget)
+        options, seen, branches = _scoped(deadline, _plan, self._client, self._episode_url)()
+        yield from list(options)
+
+        progress = _Progress()
+        if branches and _good_enough(self._policy, options):
+            progress.stopped_early = True
+            branches = []
+        branch_results = _iter_branches(branches, self._workers, deadline, progress)
+        try:
+            for _, found in branch_results:
+                for option in found:
+                    count = len(options)
+                    _add_option(options, seen, option)
+                    if len(options) > count:
+                        yield options[-1]
+                if _good_enough(self._policy, options):
+                    progress.stopped_early = True
+                    break
+        finally:
+            branch_results.close()
+            deadline.cancel()
+        self.partial = progress.partial
+
+        if cache and not progress.partial:
+            sort_options(options)
+            cache.put(self._episode_url, options, complete=not progress.stopped_early)
+
+
+def iter_video_links(
+    client,
+    episode_url: str,
+    budget: Optional[float] = None,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    policy: Optional[ResolvePolicy] = None,
+) -> LinkStream:
+    return LinkStream(
+        client,
+        episode_url,
+        budget=budget,
+        workers=workers,
+        use_cache=use_cache,
+        policy=policy,
     )
-    return options
@@ -0,0 +1,102 @@
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from bawang import config
+from bawang.models import SearchResult
+from bawang.scraper.search import parse_result_page
+from bawang.utils.catalog import Catalog, get_catalog
+from bawang.utils.net import fetch_text
+
+
+LOGGER = logging.getLogger(__name__)
+LIST_PAGE_REGEX = re.compile(r"/page/(\d+)/")
+ORDER_TITLE = "title"
+ORDER_LATEST = "latest"
+
+
+def _list_url(page: int, order: str) -> str:
+    path = config.CATALOG_PATH
+    if page > 1:
+        path = f"{path.rstrip('/')}/page/{page}/"
+    return f"{config.BASE_URL}{path}?order={order}"
+
+
+def _list_page(client, page: int, order: str) -> List[SearchResult]:
+    try:
+        html = fetch_text(client, _list_url(page, order))
+    except Exception as exc:  # noqa: BLE001 - skip pages that fail to load
+        LOGGER.debug("Catalog page %s failed: %s", page, exc)
+        return []
+    return parse_result_page(html)
+
+
+def build_catalog(
+    client,
+    catalog: Optional[Catalog] = None,
+    workers: Optional[int] = None,
+    max_pages: Optional[int] = None,
+) -> int:
+    catalog = catalog or get_catalog()
+    if not catalog:
+        return 0
+    html = fetch_text(client, _list_url(1, ORDER_TITLE))
+    added = catalog.upsert(parse_result_page(html))
+    pages = [int(value) for value in LIST_PAGE_REGEX.findall(html)]
+    last_page = min(max(pages, default=1), max_pages or config.CATALOG_MAX_PAGES)
+    if last_page > 1:
+        workers = max(1, min(workers or config.SEARCH_WORKERS, last_page - 1))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-catalog") as pool:
+            for results in pool.map(
+                lambda page: _list_page(client, page, ORDER_TITLE), range(2, last_page + 1)
+            ):
+                added += catalog.upsert(results)
+    catalog.mark_refreshed()
+    return added
+
+
+def update_catalog(
+    client, catalog: Optional[Catalog] = None, max_pages: Optional[int] = None
+) -> int:
+    catalog = catalog or get_catalog()
+    if not catalog:
+        return 0
+    changed = 0
+    for page in range(1, (max_pages or config.CATALOG_MAX_PAGES) + 1):
+        results = _list_page(client, page, ORDER_LATEST)
+        page_changed = catalog.upsert(results)
+        changed += page_changed
+        if not results or not page_changed:
+            break
+    catalog.mark_refreshed()
+    return changed
+
+
+def refresh_catalog(client, catalog: Optional[Catalog] = None, force: bool = False) -> int:
+    catalog = catalog or get_catalog()
+    if not catalog:
+        return 0
+    if not catalog.size():
+        return build_catalog(client, catalog)
+    if force or time.time() - catalog.last_refresh() >= config.CATALOG_MAX_AGE:
+        return update_catalog(client, catalog)
+    return 0
+
+
+def refresh_in_background(client) -> Optional[threading.Thread]:
+    if not get_catalog():
+        return None
+
+    def run() -> None:
+        try:
+            changed = refresh_catalog(client)
+            LOGGER.debug("Catalog refresh updated %s titles", changed)
+        except Exception as exc:  # noqa: BLE001 - background refresh is best effort
+            LOGGER.debug("Catalog refresh failed: %s", exc)
+
+    thread = threading.Thread(target=run, name="bawang-catalog", daemon=True)
+    thread.start()
+    return thread
@@ -1,21 +1,20 @@
-from typing import Optional
+from typing import Optional, Sequence
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
 from bawang import config
+from bawang.utils.dom import HtmlNode, parse_html
 from bawang.utils.net import fetch_text
 
 
-def get_soup(html: str) -> BeautifulSoup:
-    return BeautifulSoup(html, "html.parser")
+def get_soup(html: str, only: Optional[Sequence[str]] = None) -> HtmlNode:
+    return parse_html(html, only=only)
 
 
 def absolute_url(path: str) -> str:
     return urljoin(config.BASE_URL, path)
 
 
-def fetch_soup(client, url: str) -> BeautifulSoup:
+def fetch_soup(client, url: str) -> HtmlNode:
     html = fetch_text(client, url)
     return get_soup(html)
 
@@ -1,9 +1,13 @@
 import re
-from typing import List, Tuple
+import time
+from dataclasses import replace
+from typing import List, Optional, Set, Tuple
 
-from bawang.models import Episode
-from bawang.scraper.common import fetch_soup, normalize_url
+from bawang.models import Episode, EpisodeUpdate
+from bawang.scraper.common import get_soup, normalize_url
+from bawang.utils.net import NOT_MODIFIED_STATUS, fetch_if_changed, fetch_text
 from bawang.utils.text import clean_whitespace
+from bawang.utils.watchlist import ShowState, Watchlist, get_watchlist, title_from_url
 
 
 EPISODE_SELECTORS = [
@@ -35,38 +39,39 @@ def _episode_sort_key(episode: Episode) -> Tuple[int, float]:
         return (0, 0.0)
 
 
-def fetch_episodes(client, anime_url: str) -> List[Episode]:
-    soup = fetch_soup(client, anime_url)
+def _episodes_from_anchors(anchors, seen: Set[str]) -> List[Episode]:
     episodes: List[Episode] = []
-    seen = set()
+    for anchor in anchors:
+        href = normalize_url(anchor.get("href"))
+        if not href or href in seen:
+            continue
+        if "episode" not in href:
+            continue
+        title = clean_whitespace(anchor.get_text() or anchor.get("title") or "")
+        title = _format_episode_title(title)
+        if not title:
+            continue
+        episodes.append(Episode(title=title, url=href))
+        seen.add(href)
+    return episodes
 
+
+def _episodes_from_lists(soup, seen: Set[str]) -> List[Episode]:
+    episodes: List[Episode] = []
     for selector in EPISODE_SELECTORS:
-        for anchor in soup.select(selector):
-            href = normalize_url(anchor.get("href"))
-            if not href or href in seen:
-                continue
-            if "episode" not in href:
-                continue
-            title = clean_whitespace(anchor.get_text() or anchor.get("title") or "")
-            title = _format_episode_title(title)
-            if not title:
-                continue
-            episodes.append(Episode(title=title, url=href))
-            seen.add(href)
+        episodes.extend(_episodes_from_anchors(soup.select(selector), seen))
+    return episodes
+
+
+def parse_episodes(html: str) -> List[Episode]:
+    seen: Set[str] = set()
 
+    episodes = _episodes_from_lists(get_soup(html, only=EPISODE_SELECTORS), seen)
     if not episodes:
-        for anchor in soup.select("a"):
-            href = normalize_url(anchor.get("href"))
-            if not href or href in seen:
-                continue
-            if "episode" not in href:
-                continue
-            title = clean_whitespace(anchor.get_text() or anchor.get("title") or "")
-            title = _format_episode_title(title)
-            if not title:
-                continue
-            episodes.append(Episode(title=title, url=href))
-            seen.add(href)
+        soup = get_soup(html)
+        episodes = _episodes_from_lists(soup, seen)
+        if not episodes:
+            episodes = _episodes_from_anchors(soup.select("a"), seen)
 
     with_numbers = [ep for ep in episodes if _episode_sort_key(ep)[0] == 1]
     if with_numbers:
@@ -74,3 +79,42 @@ def fetch_episodes(client, anime_url: str) -> List[Episode]:
         episodes.sort(key=_episode_sort_key, reverse=True)
 
     return episodes
+
+
+def fetch_episodes(client, anime_url: str) -> List[Episode]:
+    return parse_episodes(fetch_text(client, anime_url))
+
+
+def refresh_episodes(
+    client, anime_url: str, store: Optional[Watchlist] = None
+) -> EpisodeUpdate:
+    store = store or get_watchlist()
+    state = store.get(anime_url)
+    if state is None:
+        state = ShowState(anime_url=anime_url, title=title_from_url(anime_url))
+    validators = state.validators if state.episodes else None
+    response = fetch_if_changed(client, anime_url, validators=validators)
+    if response.status == NOT_MODIFIED_STATUS:
+        store.save(replace(state, checked_at=time.time()))
+        return EpisodeUpdate(anime_url, state.title, episodes=state.episodes)
+
+    episodes = parse_episodes(response.text)
+    known = {episode.url for episode in state.episodes}
+    new = [episode for episode in episodes if episode.url not in known] if known else []
+    store.save(
+        replace(
+            state,
+            episodes=episodes,
+            etag=response.etag,
+            last_modified=response.last_modified,
+            checked_at=time.time(),
+        )
+    )
+    return EpisodeUpdate(
+        anime_url,
+        state.title,
+        episodes=episodes,
+        new=new,
+        changed=[episode.url for episode in episodes]
+        != [episode.url for episode in state.episodes],
+    )
@@ -1,12 +1,20 @@
-from typing import List
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Iterator, List, Optional, Set
 from urllib.parse import quote_plus
 
 from bawang import config
 from bawang.models import SearchResult
-from bawang.scraper.common import fetch_soup, normalize_url
+from bawang.scraper.common import get_soup, normalize_url
+from bawang.utils.catalog import Catalog, get_catalog
+from bawang.utils.net import fetch_text
 from bawang.utils.text import clean_whitespace
 
 
+LOGGER = logging.getLogger(__name__)
+PAGE_LINK_REGEX = re.compile(r"/page/(\d+)/?\?s=")
 CARD_SELECTORS = [
     "div.animepost",
     "div.animpos",
@@ -38,13 +46,8 @@ def _extract_from_card(card) -> SearchResult | None:
     return SearchResult(title=title, url=href, thumbnail=thumb or None)
 
 
-def search_anime(client, query: str) -> List[SearchResult]:
-    safe_query = quote_plus(query.strip())
-    url = config.BASE_URL + config.SEARCH_PATH.format(query=safe_query)
-    soup = fetch_soup(client, url)
+def _results_from_cards(soup, seen: Set[str]) -> List[SearchResult]:
     results: List[SearchResult] = []
-    seen = set()
-
     for selector in CARD_SELECTORS:
         for card in soup.select(selector):
             result = _extract_from_card(card)
@@ -52,7 +55,17 @@ def search_anime(client, query: str) -> List[SearchResult]:
                 continue
             results.append(result)
             seen.add(result.url)
+    return results
+
+
+def parse_result_page(html: str) -> List[SearchResult]:
+    seen: Set[str] = set()
+    results = _results_from_cards(get_soup(html, only=CARD_SELECTORS), seen)
+    if results:
+        return results
 
+    soup = get_soup(html)
+    results = _results_from_cards(soup, seen)
     if results:
         return results
 
@@ -65,3 +78,89 @@ def search_anime(client, query: str) -> List[SearchResult]:
         seen.add(href)
 
     return results
+
+
+def _page_count(html: str) -> int:
+    pages = [int(value) for value in PAGE_LINK_REGEX.findall(html)]
+    return max(pages, default=1)
+
+
+def _search_url(safe_query: str, page: int) -> str:
+    if page <= 1:
+        return config.BASE_URL + config.SEARCH_PATH.format(query=safe_query)
+    return config.BASE_URL + config.SEARCH_PAGE_PATH.format(page=page, query=safe_query)
+
+
+def _fetch_page(client, safe_query: str, page: int) -> List[SearchResult]:
+    try:
+        html = fetch_text(client, _search_url(safe_query, page))
+    except Exception as exc:  # noqa: BLE001 - later pages are best effort
+        LOGGER.debug("Search page %s failed: %s", page, exc)
+        return []
+    return parse_result_page(html)
+
+
+def _live_results(
+    client,
+    query: str,
+    catalog: Optional[Catalog],
+    max_pages: Optional[int],
+    workers: Optional[int],
+) -> Iterator[SearchResult]:
+    safe_query = quote_plus(query.strip())
+    html = fetch_text(client, _search_url(safe_query, 1))
+
+    def fresh(results: List[SearchResult]) -> List[SearchResult]:
+        if catalog:
+            catalog.upsert(results)
+        return results
+
+    yield from fresh(parse_result_page(html))
+
+    if max_pages is None:
+        max_pages = config.SEARCH_MAX_PAGES
+    last_page = min(_page_count(html), max_pages)
+    if last_page <= 1:
+        return
+    workers = max(1, min(workers or config.SEARCH_WORKERS, last_page - 1))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-search")
+    try:
+        futures = [
+            pool.submit(_fetch_page, client, safe_query, page)
+            for page in range(2, last_page + 1)
+        ]
+        for future in futures:
+            yield from fresh(future.result())
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_search_results(
+    client,
+    query: str,
+    max_pages: Optional[int] = None,
+    workers: Optional[int] = None,
+    use_catalog: bool = True,
+) -> Iterator[SearchResult]:
+    catalog = get_catalog() if use_catalog else None
+    fuzzy: List[SearchResult] = []
+    if catalog:
+        hits = catalog.search(query, confident_only=True)
+        if hits:
+            yield from hits
+            return
+        fuzzy = catalog.search(query)
+
+    seen: Set[str] = set()
+    for result in chain(_live_results(client, query, catalog, max_pages, workers), fuzzy):
+        if result.url not in seen:
+            seen.add(result.url)
+            yield result
+
+
+def search_anime(
+    client, query: str, max_pages: Optional[int] = None, use_catalog: bool = True
+) -> List[SearchResult]:
+    return list(
+        iter_search_results(client, query, max_pages=max_pages, use_catalog=use_catalog)
+    )
@@ -0,0 +1,53 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from bawang import config
+from bawang.models import EpisodeUpdate
+from bawang.scraper.episodes import refresh_episodes
+from bawang.utils.watchlist import Watchlist, get_watchlist
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def poll_followed(
+    client, store: Optional[Watchlist] = None, workers: Optional[int] = None
+) -> List[EpisodeUpdate]:
+    store = store or get_watchlist()
+    shows = store.followed()
+    if not shows:
+        return []
+
+    def check(anime_url: str) -> Optional[EpisodeUpdate]:
+        try:
+            return refresh_episodes(client, anime_url, store)
+        except Exception as exc:  # noqa: BLE001 - one broken show must not stop the poll
+            LOGGER.warning("Failed to refresh %s: %s", anime_url, exc)
+            return None
+
+    workers = max(1, min(workers or config.WATCH_WORKERS, len(shows)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bawang-watch") as pool:
+        updates = pool.map(check, [show.anime_url for show in shows])
+        return [update for update in updates if update is not None]
+
+
+def watch_followed(
+    client,
+    on_new: Callable[[EpisodeUpdate], None],
+    interval: Optional[float] = None,
+    rounds: Optional[int] = None,
+    store: Optional[Watchlist] = None,
+) -> None:
+    interval = config.WATCH_INTERVAL if interval is None else interval
+    completed = 0
+    while rounds is None or completed < rounds:
+        started = time.monotonic()
+        for update in poll_followed(client, store):
+            if update.new:
+                on_new(update)
+        completed += 1
+        if rounds is not None and completed >= rounds:
+            return
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
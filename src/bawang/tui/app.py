@@ -7,17 +7,22 @@ try:
 except ImportError:  # pragma: no cover - optional fallback
     requests = None
 
+from bawang import config
 from bawang.player import ffplay, mpv
 from bawang.player.detect import detect_player
-from bawang.resolver.resolve import resolve_video_links
-from bawang.scraper.episodes import fetch_episodes
-from bawang.scraper.search import search_anime
+from bawang.resolver.probe import probe_options
+from bawang.resolver.resolve import default_policy, iter_video_links
+from bawang.scraper.catalog import refresh_in_background
+from bawang.scraper.search import iter_search_results
 from bawang.tui.events import prompt_confirm
+from bawang.tui.prefetch import Prefetcher
 from bawang.tui.screens import (
     show_episode_list,
     show_home,
     show_quality_select,
     show_search_results,
+    stream_quality_options,
+    stream_search_results,
 )
 from bawang.tui.widgets import now_playing_panel
 from bawang.utils.log import configure_logging
@@ -32,7 +37,8 @@ def _format_error(exc: Exception) -> str:
         status = exc.response.status_code
     if status in {403, 429}:
         return (
-            "Blocked by the site (HTTP 403/429). Try again later or switch domain."
+            "Blocked by the site (HTTP 403/429). "
+            "Try again later or add mirrors via BWN_MIRRORS."
         )
     return f"{exc.__class__.__name__}: {exc}"
 
@@ -52,7 +58,11 @@ def run_app() -> None:
         console.print("No media player found. Install mpv or ffplay.", style="red")
         return
 
-    with get_client() as client:
+    with get_client() as client, Prefetcher(client) as prefetcher:
+        if config.PRECONNECT_ENABLED:
+            client.preconnect()
+        if config.CATALOG_ENABLED:
+            refresh_in_background(client)
         while True:
             query = show_home(console)
             if query is None:
@@ -62,8 +72,9 @@ def run_app() -> None:
                 continue
 
             try:
-                with console.status("Searching..."):
-                    results = search_anime(client, query)
+                results = stream_search_results(
+                    console, query, iter_search_results(client, query)
+                )
             except Exception as exc:  # noqa: BLE001 - user facing error
                 console.print(_format_error(exc), style="red")
                 if prompt_confirm(console, "Search again?", default=True):
@@ -78,6 +89,9 @@ def run_app() -> None:
 
             search_again = False
             while True:
+                prefetcher.cancel()
+                if config.PREFETCH_ENABLED:
+                    prefetcher.prefetch_episodes(results)
                 selection, chosen = show_search_results(console, query, results)
                 if selection.action == "quit":
                     return
@@ -88,7 +102,7 @@ def run_app() -> None:
 
                 try:
                     with console.status("Fetching episodes..."):
-                        episodes = fetch_episodes(client, chosen.url)
+                        episodes = prefetcher.episodes(chosen.url)
                 except Exception as exc:  # noqa: BLE001 - user facing error
                     console.print(_format_error(exc), style="red")
                     if prompt_confirm(console, "Back to results?", default=True):
@@ -102,6 +116,9 @@ def run_app() -> None:
                     return
 
                 while True:
+                    prefetcher.cancel()
+                    if config.PREFETCH_ENABLED:
+                        prefetcher.prefetch_links(episodes)
                     selection, episode = show_episode_list(
                         console, chosen.title, episodes
                     )
@@ -113,8 +130,20 @@ def run_app() -> None:
                         continue
 
                     try:
-                        with console.status("Resolving video links..."):
-                            options = resolve_video_links(client, episode.url)
+                        resolved = prefetcher.prefetched_links(episode.url)
+                        if resolved is not None:
+                            options, partial = resolved.options, resolved.partial
+                        else:
+                            options, partial = stream_quality_options(
+                                console,
+                                episode.title,
+                                iter_video_links(
+                                    client,
+                                    episode.url,
+                                    budget=config.RESOLVE_BUDGET,
+                                    policy=default_policy(),
+                                ),
+                            )
                     except Exception as exc:  # noqa: BLE001 - user facing error
                         console.print(_format_error(exc), style="red")
                         if prompt_confirm(console, "Back to episodes?", default=True):
@@ -127,8 +156,12 @@ def run_app() -> None:
                             continue
                         return
 
+                    if config.PROBE_ENABLED:
+                        with console.status("Checking links..."):
+                            options = probe_options(client, options)
+
                     selection, choice = show_quality_select(
-                        console, episode.title, options
+                        console, episode.title, options, partial=partial
                     )
                     if selection.action == "quit":
                         return
@@ -0,0 +1,107 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, TypeVar
+
+from bawang import config
+from bawang.models import Episode, ResolveResult, SearchResult
+from bawang.resolver.resolve import default_policy, resolve_links
+from bawang.scraper.episodes import fetch_episodes
+
+
+LOGGER = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class Prefetcher:
+    def __init__(self, client, workers: Optional[int] = None) -> None:
+        self._client = client
+        self._workers = max(1, workers or config.PREFETCH_WORKERS)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="bawang-prefetch"
+        )
+        self._episodes: Dict[str, Future] = {}
+        self._links: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+
+    def __enter__(self) -> "Prefetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancel.set()
+            self._cancel = threading.Event()
+            for key, future in list(self._episodes.items()):
+                if future.cancel():
+                    del self._episodes[key]
+            for future in self._links.values():
+                future.cancel()
+            self._links.clear()
+
+    def prefetch_episodes(self, results: List[SearchResult]) -> None:
+        for result in results[: config.PREFETCH_RESULTS]:
+            self._submit(self._episodes, result.url, fetch_episodes, self._client, result.url)
+
+    def prefetch_links(self, episodes: List[Episode]) -> None:
+        for episode in episodes[: config.PREFETCH_EPISODES]:
+            self._submit(
+                self._links,
+                episode.url,
+                resolve_links,
+                self._client,
+                episode.url,
+                budget=config.RESOLVE_BUDGET,
+                workers=self._workers,
+                policy=default_policy(),
+                cancel=self._cancel,
+            )
+
+    def episodes(self, anime_url: str) -> List[Episode]:
+        return self._take(self._episodes, anime_url, fetch_episodes, anime_url)
+
+    def prefetched_links(self, episode_url: str) -> Optional[ResolveResult]:
+        with self._lock:
+            future = self._links.get(episode_url)
+            if future is None or not future.done():
+                return None
+            del self._links[episode_url]
+            if future.cancelled():
+                return None
+        try:
+            return future.result()
+        except Exception as exc:  # noqa: BLE001 - caller resolves in the foreground
+            LOGGER.debug("Prefetch for %s failed: %s", episode_url, exc)
+            return None
+
+    def _submit(self, jobs: Dict[str, Future], key: str, func: Callable, *args, **kwargs) -> None:
+        with self._lock:
+            future = jobs.get(key)
+            if future is not None and not future.cancelled():
+                if not future.done() or future.exception() is None:
+                    return
+            try:
+                jobs[key] = self._executor.submit(func, *args, **kwargs)
+            except RuntimeError:
+                return
+
+    def _take(
+        self, jobs: Dict[str, Future], key: str, func: Callable[..., T], *args
+    ) -> T:
+        with self._lock:
+            future = jobs.pop(key, None)
+            if future is not None and future.cancel():
+                future = None
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as exc:  # noqa: BLE001 - retry in the foreground
+                LOGGER.debug("Prefetch for %s failed: %s", key, exc)
+        return func(self._client, *args)
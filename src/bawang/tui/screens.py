@@ -1,10 +1,12 @@
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from urllib.parse import urlparse
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.text import Text
 
 from bawang.models import Episode, QualityOption, SearchResult
+from bawang.resolver.resolve import sort_options
 from bawang.tui.events import Selection, prompt_selection, prompt_text, use_arrow_ui
 from bawang.tui.widgets import (
     episodes_table,
@@ -35,6 +37,33 @@ def show_home(console: Console) -> Optional[str]:
     return prompt_text(console, "Search anime")
 
 
+def stream_search_results(
+    console: Console, query: str, stream: Iterable[SearchResult]
+) -> List[SearchResult]:
+    results: List[SearchResult] = []
+
+    def render() -> Group:
+        return Group(
+            header_panel(
+                "Results", subtitle=f"Query: {query} - searching, {len(results)} found"
+            ),
+            search_results_table(results),
+            Text("Press Ctrl+C to choose from the results found so far.", style="dim"),
+        )
+
+    console.clear()
+    with Live(render(), console=console, refresh_per_second=8, transient=True) as live:
+        try:
+            for result in stream:
+                results.append(result)
+                live.update(render())
+        except KeyboardInterrupt:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+    return results
+
+
 def show_search_results(
     console: Console, query: str, results: List[SearchResult]
 ) -> tuple[Selection, Optional[SearchResult]]:
@@ -103,8 +132,42 @@ def show_episode_list(
     return selection, episodes[selection.index or 0]
 
 
+def stream_quality_options(
+    console: Console, episode_title: str, stream: Iterable[QualityOption]
+) -> tuple[List[QualityOption], bool]:
+    options: List[QualityOption] = []
+    interrupted = False
+
+    def render() -> Group:
+        return Group(
+            header_panel(
+                "Quality",
+                subtitle=f"{episode_title} - resolving, {len(options)} found",
+            ),
+            quality_table(options),
+            Text("Press Ctrl+C to choose from the links found so far.", style="dim"),
+        )
+
+    console.clear()
+    with Live(render(), console=console, refresh_per_second=8, transient=True) as live:
+        try:
+            for option in stream:
+                options.append(option)
+                sort_options(options)
+                live.update(render())
+        except KeyboardInterrupt:
+            interrupted = True
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+    return options, interrupted or bool(getattr(stream, "partial", False))
+
+
 def show_quality_select(
-    console: Console, episode_title: str, options: List[QualityOption]
+    console: Console,
+    episode_title: str,
+    options: List[QualityOption],
+    partial: bool = False,
 ) -> tuple[Selection, Optional[QualityOption]]:
     console.clear()
     console.print(
@@ -119,6 +182,13 @@ def show_quality_select(
         )
         return Selection("back"), None
     console.print(quality_table(options))
+    if partial:
+        console.print(
+            message_panel(
+                "Some sources timed out. Showing the links found so far.",
+                style="yellow",
+            )
+        )
     if use_arrow_ui():
         console.print(
             Text(
@@ -132,6 +202,8 @@ def show_quality_select(
         label = item.label
         if host:
             label = f"{label} - {host}"
+        if item.alive is False:
+            label = f"{label} (dead)"
         option_labels.append(label)
     labels = _build_labels(option_labels)
     selection = prompt_selection(
@@ -9,6 +9,7 @@ from rich.table import Table
 from rich.text import Text
 
 from bawang.models import Episode, QualityOption, SearchResult
+from bawang.resolver.probe import is_slow
 from bawang.utils.text import truncate
 
 
@@ -104,11 +105,30 @@ def episodes_table(episodes: List[Episode]) -> Table:
     return table
 
 
+def probe_text(option: QualityOption) -> Text:
+    if option.alive is None:
+        return Text("-", style="dim")
+    if option.alive is False:
+        return Text("dead", style="red")
+    parts = []
+    if option.ttfb is not None:
+        parts.append(f"{option.ttfb * 1000:.0f} ms")
+    if option.throughput is not None:
+        parts.append(f"{option.throughput / 1_000_000:.1f} MB/s")
+    return Text(" / ".join(parts) or "ok", style="yellow" if is_slow(option) else "green")
+
+
 def quality_table(options: List[QualityOption]) -> Table:
+    probed = any(item.alive is not None for item in options)
+    variants = any(item.bandwidth for item in options)
     table = _base_table("Quality")
     table.add_column("#", style="cyan", width=4)
     table.add_column("Label", style="bold")
     table.add_column("Host", style="magenta")
+    if variants:
+        table.add_column("Bitrate", justify="right")
+    if probed:
+        table.add_column("Check")
     table.add_column("URL", style="dim")
     for idx, item in enumerate(options, start=1):
         host = ""
@@ -116,5 +136,11 @@ def quality_table(options: List[QualityOption]) -> Table:
             host = urlparse(item.url).netloc.replace("www.", "")
         except ValueError:
             host = ""
-        table.add_row(str(idx), item.label, host, truncate(item.url, 60))
+        cells = [str(idx), item.label, host]
+        if variants:
+            cells.append(f"{item.bandwidth // 1000} kbps" if item.bandwidth else "-")
+        if probed:
+            cells.append(probe_text(item))
+        cells.append(truncate(item.url, 60))
+        table.add_row(*cells)
     return table
@@ -0,0 +1,214 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from bawang import config
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    body: str
+    url_class: str
+    age: float
+    fresh: bool
+    stale_ok: bool
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def classify_url(url: str) -> Optional[str]:
+    parsed = urlparse(url)
+    site_hosts = {urlparse(mirror).netloc.lower() for mirror in config.MIRROR_URLS}
+    if not parsed.netloc:
+        return None
+    if parsed.netloc.lower() not in site_hosts:
+        return "embed"
+    if "s" in parse_qs(parsed.query):
+        return "search"
+    path = parsed.path.lower()
+    if path.startswith("/anime/"):
+        return "anime"
+    if "episode" in path:
+        return "episode"
+    return None
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = config.HTTP_CACHE_MAX_BYTES,
+        ttls: Optional[Dict[str, int]] = None,
+        stale: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self._ttls = ttls if ttls is not None else config.HTTP_CACHE_TTLS
+        self._stale = stale if stale is not None else config.HTTP_CACHE_STALE
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, url_class TEXT NOT NULL, body BLOB NOT NULL, "
+            "size INTEGER NOT NULL, stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        for column in ("etag", "last_modified"):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS stats ("
+            "url_class TEXT NOT NULL, outcome TEXT NOT NULL, count INTEGER NOT NULL, "
+            "PRIMARY KEY (url_class, outcome))"
+        )
+        self._conn.commit()
+        self._counts: Counter = Counter()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_counts()
+            self._conn.close()
+
+    def record(self, url_class: Optional[str], outcome: str) -> None:
+        if url_class is None:
+            return
+        with self._lock:
+            self._counts[(url_class, outcome)] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            self._flush_counts()
+            rows = self._conn.execute("SELECT url_class, outcome, count FROM stats").fetchall()
+        result: Dict[str, Dict[str, int]] = {}
+        for url_class, outcome, count in rows:
+            result.setdefault(url_class, {})[outcome] = count
+        return result
+
+    def _flush_counts(self) -> None:
+        if not self._counts:
+            return
+        items: list[Tuple[str, str, int]] = [
+            (url_class, outcome, count) for (url_class, outcome), count in self._counts.items()
+        ]
+        self._conn.executemany(
+            "INSERT INTO stats (url_class, outcome, count) VALUES (?, ?, ?) "
+            "ON CONFLICT (url_class, outcome) DO UPDATE SET count = count + excluded.count",
+            items,
+        )
+        self._conn.commit()
+        self._counts.clear()
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        url_class = classify_url(url)
+        if url_class is None:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at, etag, last_modified FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+            )
+            self._conn.commit()
+        body, stored_at, etag, last_modified = row
+        try:
+            text = zlib.decompress(body).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError):
+            self.discard(url)
+            return None
+        age = max(0.0, now - stored_at)
+        ttl = self._ttls.get(url_class, 0)
+        return CacheEntry(
+            body=text,
+            url_class=url_class,
+            age=age,
+            fresh=age < ttl,
+            stale_ok=age < ttl + self._stale.get(url_class, 0),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def store(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        url_class = classify_url(url)
+        if url_class is None or self._ttls.get(url_class, 0) <= 0:
+            return
+        body = zlib.compress(text.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, url_class, body, size, stored_at, accessed_at, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, url_class, body, len(body), now, now, etag, last_modified),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def discard(self, url: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+        victims = []
+        for url, size in self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ):
+            if total <= self._max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+
+def open_response_cache(directory: Optional[str] = None) -> Optional[ResponseCache]:
+    directory = directory or config.CACHE_DIR
+    try:
+        os.makedirs(directory, exist_ok=True)
+        return ResponseCache(os.path.join(directory, "http.sqlite3"))
+    except (OSError, sqlite3.Error) as exc:
+        LOGGER.debug("HTTP cache unavailable: %s", exc)
+        return None
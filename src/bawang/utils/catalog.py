@@ -0,0 +1,171 @@
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Set
+
+from bawang import config
+from bawang.models import SearchResult
+
+
+LOGGER = logging.getLogger(__name__)
+NON_WORD_REGEX = re.compile(r"[\W_]+", re.UNICODE)
+MAX_QUERY_GRAMS = 64
+
+
+def normalize_title(value: str) -> str:
+    return " ".join(NON_WORD_REGEX.sub(" ", value.lower()).split())
+
+
+def trigrams(value: str) -> Set[str]:
+    padded = f"  {normalize_title(value)} "
+    return {padded[idx : idx + 3] for idx in range(len(padded) - 2)}
+
+
+def _confident(needle: str, title: str, similarity: float) -> bool:
+    if f" {needle} " in f" {title} ":
+        return True
+    return similarity >= config.CATALOG_CONFIDENT_SCORE
+
+
+class Catalog:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+            self._conn.executescript(
+                "CREATE TABLE IF NOT EXISTS titles ("
+                "url TEXT PRIMARY KEY, title TEXT NOT NULL, thumbnail TEXT, "
+                "grams INTEGER NOT NULL, updated_at REAL NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS trigrams ("
+                "gram TEXT NOT NULL, url TEXT NOT NULL, PRIMARY KEY (gram, url)"
+                ") WITHOUT ROWID;"
+                "CREATE INDEX IF NOT EXISTS trigrams_url ON trigrams (url);"
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            )
+            self._conn.commit()
+        except sqlite3.Error as exc:
+            LOGGER.debug("Catalog store unavailable: %s", exc)
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def size(self) -> int:
+        with self._lock:
+            if not self._conn:
+                return 0
+            return self._conn.execute("SELECT COUNT(*) FROM titles").fetchone()[0]
+
+    def last_refresh(self) -> float:
+        with self._lock:
+            if not self._conn:
+                return 0.0
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'refreshed_at'"
+            ).fetchone()
+        return float(row[0]) if row else 0.0
+
+    def mark_refreshed(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            if not self._conn:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                (str(now),),
+            )
+            self._conn.commit()
+
+    def upsert(self, results: Iterable[SearchResult]) -> int:
+        changed = 0
+        now = time.time()
+        with self._lock:
+            if not self._conn:
+                return 0
+            for result in results:
+                row = self._conn.execute(
+                    "SELECT title, thumbnail FROM titles WHERE url = ?", (result.url,)
+                ).fetchone()
+                if row and row[0] == result.title and (row[1] or None) == result.thumbnail:
+                    continue
+                grams = trigrams(result.title)
+                self._conn.execute("DELETE FROM trigrams WHERE url = ?", (result.url,))
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO trigrams (gram, url) VALUES (?, ?)",
+                    [(gram, result.url) for gram in grams],
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO titles (url, title, thumbnail, grams, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (result.url, result.title, result.thumbnail, len(grams), now),
+                )
+                changed += 1
+            self._conn.commit()
+        return changed
+
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        min_score: Optional[float] = None,
+        confident_only: bool = False,
+    ) -> List[SearchResult]:
+        grams = sorted(trigrams(query))[:MAX_QUERY_GRAMS]
+        if not normalize_title(query) or not grams:
+            return []
+        if min_score is None:
+            min_score = config.CATALOG_MIN_SCORE
+        placeholders = ", ".join("?" for _ in grams)
+        with self._lock:
+            if not self._conn:
+                return []
+            rows = self._conn.execute(
+                "SELECT t.url, t.title, t.thumbnail, t.grams, COUNT(*) AS shared "
+                "FROM trigrams g JOIN titles t ON t.url = g.url "
+                f"WHERE g.gram IN ({placeholders}) "
+                "GROUP BY t.url",
+                grams,
+            ).fetchall()
+        needle = normalize_title(query)
+        ranked = []
+        for url, title, thumbnail, title_grams, shared in rows:
+            coverage = shared / len(grams)
+            if coverage < min_score:
+                continue
+            similarity = shared / (len(grams) + title_grams - shared)
+            normalized = normalize_title(title)
+            exact = needle in normalized
+            if confident_only and not _confident(needle, normalized, similarity):
+                continue
+            ranked.append(
+                (exact, coverage, similarity, SearchResult(title, url, thumbnail or None))
+            )
+        ranked.sort(key=lambda item: item[:3], reverse=True)
+        return [item[3] for item in ranked[:limit]]
+
+
+_CATALOG: Optional[Catalog] = None
+_CATALOG_LOCK = threading.Lock()
+
+
+def get_catalog() -> Optional[Catalog]:
+    global _CATALOG
+    if not config.CATALOG_ENABLED:
+        return None
+    with _CATALOG_LOCK:
+        if _CATALOG is None:
+            path = None
+            try:
+                os.makedirs(config.CACHE_DIR, exist_ok=True)
+                path = os.path.join(config.CACHE_DIR, "catalog.sqlite3")
+            except OSError as exc:
+                LOGGER.debug("Catalog directory unavailable: %s", exc)
+            _CATALOG = Catalog(path)
+        return _CATALOG
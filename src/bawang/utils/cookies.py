@@ -0,0 +1,52 @@
+import logging
+import os
+import threading
+from http.cookiejar import LoadError, LWPCookieJar
+from typing import Optional
+
+from bawang import config
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+def load_cookie_jar(path: Optional[str] = None) -> LWPCookieJar:
+    jar = LWPCookieJar(path)
+    if path and os.path.exists(path):
+        try:
+            jar.load(ignore_discard=True)
+        except (OSError, LoadError) as exc:
+            LOGGER.debug("Could not load cookies from %s: %s", path, exc)
+    jar.clear_expired_cookies()
+    return jar
+
+
+def save_cookie_jar(jar: LWPCookieJar) -> None:
+    if not jar.filename:
+        return
+    jar.clear_expired_cookies()
+    try:
+        os.close(os.open(jar.filename, os.O_WRONLY | os.O_CREAT, 0o600))
+        os.chmod(jar.filename, 0o600)
+        jar.save(ignore_discard=True)
+    except OSError as exc:
+        LOGGER.debug("Could not save cookies to %s: %s", jar.filename, exc)
+
+
+_COOKIE_JAR: Optional[LWPCookieJar] = None
+_COOKIE_JAR_LOCK = threading.Lock()
+
+
+def get_cookie_jar() -> LWPCookieJar:
+    global _COOKIE_JAR
+    with _COOKIE_JAR_LOCK:
+        if _COOKIE_JAR is None:
+            path = None
+            if config.COOKIE_JAR_ENABLED:
+                try:
+                    os.makedirs(config.CACHE_DIR, exist_ok=True)
+                    path = os.path.join(config.CACHE_DIR, "cookies.txt")
+                except OSError as exc:
+                    LOGGER.debug("Cookie directory unavailable: %s", exc)
+            _COOKIE_JAR = load_cookie_jar(path)
+        return _COOKIE_JAR
@@ -0,0 +1,74 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from bawang import config
+
+
+MIN_REQUEST_TIMEOUT = 1.0
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Deadline:
+    def __init__(
+        self, budget: Optional[float] = None, cancel: Optional[threading.Event] = None
+    ) -> None:
+        self._expires_at = time.monotonic() + budget if budget is not None else None
+        self._cancelled = threading.Event()
+        self._parent = cancel
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or bool(self._parent and self._parent.is_set())
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def remaining(self) -> Optional[float]:
+        if self.cancelled:
+            return 0.0
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def timeout(self, default: float) -> float:
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        if remaining <= 0:
+            raise DeadlineExceeded("cancelled" if self.cancelled else "time budget exhausted")
+        return min(default, max(MIN_REQUEST_TIMEOUT, remaining))
+
+
+_CURRENT: ContextVar[Optional[Deadline]] = ContextVar("bawang_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _CURRENT.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    token = _CURRENT.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _CURRENT.reset(token)
+
+
+def request_timeout(default: Optional[float] = None) -> float:
+    if default is None:
+        default = config.DEFAULT_TIMEOUT
+    deadline = _CURRENT.get()
+    if deadline is None:
+        return default
+    return deadline.timeout(default)
@@ -0,0 +1,130 @@
+import logging
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Union
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from bawang import config
+
+try:
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional backend
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional backend
+    LexborHTMLParser = None
+
+
+LOGGER = logging.getLogger(__name__)
+BACKENDS = ("lexbor", "lxml", "html.parser")
+_SKIP_TEXT_PARENTS = {"script", "style", "template"}
+
+
+class LexborNode:
+    __slots__ = ("_node",)
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    def select(self, selector: str) -> List["LexborNode"]:
+        return [LexborNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional["LexborNode"]:
+        node = self._node.css_first(selector)
+        if node is None:
+            return None
+        return LexborNode(node)
+
+    def get(self, name: str, default=None):
+        attributes = self._node.attributes
+        if name not in attributes:
+            return default
+        value = attributes[name]
+        return "" if value is None else value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        parts: List[str] = []
+        for node in self._node.traverse(include_text=True):
+            if node.tag != "-text":
+                continue
+            parent = node.parent
+            if parent is not None and parent.tag in _SKIP_TEXT_PARENTS:
+                continue
+            value = node.text_content or ""
+            if strip:
+                value = value.strip()
+                if not value:
+                    continue
+            parts.append(value)
+        return separator.join(parts)
+
+
+HtmlNode = Union[Tag, LexborNode]
+
+
+def available_backends() -> List[str]:
+    backends = []
+    if LexborHTMLParser is not None:
+        backends.append("lexbor")
+    if lxml is not None:
+        backends.append("lxml")
+    backends.append("html.parser")
+    return backends
+
+
+@lru_cache(maxsize=None)
+def resolve_backend(name: Optional[str] = None) -> str:
+    requested = (name or config.HTML_PARSER or "auto").strip().lower()
+    available = available_backends()
+    if requested in {"", "auto"}:
+        return available[0]
+    if requested in {"selectolax", "modest"}:
+        requested = "lexbor"
+    if requested not in BACKENDS:
+        LOGGER.warning("Unknown HTML parser %r, using %s", requested, available[0])
+        return available[0]
+    if requested not in available:
+        LOGGER.debug("HTML parser %s not installed, using %s", requested, available[0])
+        return available[0]
+    return requested
+
+
+def _region_strainer(selectors: Iterable[str]) -> Optional[SoupStrainer]:
+    names = set()
+    classes = set()
+    for selector in selectors:
+        head = selector.split(",")[0].split()[0] if selector.strip() else ""
+        name, _, class_name = head.partition(".")
+        if not name or not class_name or "." in class_name:
+            return None
+        names.add(name)
+        classes.add(class_name)
+    if not names:
+        return None
+    wanted = frozenset(classes)
+
+    def has_class(value) -> bool:
+        if not value:
+            return False
+        values = value.split() if isinstance(value, str) else value
+        return any(item in wanted for item in values)
+
+    return SoupStrainer(sorted(names), attrs={"class": has_class})
+
+
+def parse_html(
+    html: str,
+    backend: Optional[str] = None,
+    only: Optional[Sequence[str]] = None,
+) -> HtmlNode:
+    backend = resolve_backend(backend)
+    if backend == "lexbor":
+        parser = LexborHTMLParser(html)
+        root = parser.root
+        return LexborNode(root if root is not None else parser)
+    strainer = _region_strainer(only) if only else None
+    if strainer is not None:
+        return BeautifulSoup(html, backend, parse_only=strainer)
+    return BeautifulSoup(html, backend)
@@ -0,0 +1,138 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from bawang import config
+
+
+LOGGER = logging.getLogger(__name__)
+SEARCH_PAGE_MARKERS = ('name="s"', "name='s'", "animepost", "search-results")
+
+
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _looks_like_search_page(text: str) -> bool:
+    lowered = text.lower()
+    return "</html>" in lowered and any(marker in lowered for marker in SEARCH_PAGE_MARKERS)
+
+
+def probe_mirror(base_url: str, timeout: float = config.MIRROR_PROBE_TIMEOUT) -> Optional[float]:
+    url = base_url + config.SEARCH_PATH.format(query="a")
+    started = time.monotonic()
+    try:
+        with httpx.Client(
+            headers={"User-Agent": config.USER_AGENT}, timeout=timeout, follow_redirects=True
+        ) as client:
+            response = client.get(url)
+    except httpx.HTTPError as exc:
+        LOGGER.debug("Mirror %s unreachable: %s", base_url, exc)
+        return None
+    if response.status_code != 200 or not _looks_like_search_page(response.text):
+        LOGGER.debug("Mirror %s unhealthy (HTTP %s)", base_url, response.status_code)
+        return None
+    return time.monotonic() - started
+
+
+class MirrorPool:
+    def __init__(self, mirrors: List[str], probe=probe_mirror) -> None:
+        self._mirrors = [mirror.rstrip("/") for mirror in mirrors if mirror]
+        self._hosts = {_netloc(mirror) for mirror in self._mirrors}
+        self._probe = probe
+        self._pinned = self._mirrors[0] if self._mirrors else config.BASE_URL
+        self._probed_at = 0.0
+        self._lock = threading.Lock()
+        self._probing = threading.Lock()
+
+    @property
+    def pinned(self) -> str:
+        return self._pinned
+
+    @property
+    def enabled(self) -> bool:
+        return len(self._mirrors) > 1
+
+    def is_mirror(self, url: str) -> bool:
+        return _netloc(url) in self._hosts
+
+    def rewrite(self, url: str) -> str:
+        if not self.enabled:
+            return url
+        if not self._probed_at:
+            self._first_probe()
+        elif time.monotonic() - self._probed_at > config.MIRROR_REPROBE_INTERVAL:
+            self.probe_in_background()
+        parsed = urlparse(url)
+        if parsed.netloc.lower() not in self._hosts:
+            return url
+        pinned = urlparse(self._pinned)
+        if parsed.netloc.lower() == pinned.netloc.lower():
+            return url
+        return parsed._replace(scheme=pinned.scheme, netloc=pinned.netloc).geturl()
+
+    def probe(self) -> str:
+        if not self.enabled:
+            return self._pinned
+        with self._probing:
+            return self._race()
+
+    def _first_probe(self) -> None:
+        with self._probing:
+            if not self._probed_at:
+                self._race()
+
+    def _race(self) -> str:
+        pool = ThreadPoolExecutor(
+            max_workers=len(self._mirrors), thread_name_prefix="bawang-mirror"
+        )
+        futures = {pool.submit(self._probe, mirror): mirror for mirror in self._mirrors}
+        winner = None
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and future.result() is not None:
+                    winner = futures[future]
+                    break
+        pool.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._probed_at = time.monotonic()
+            if winner and winner != self._pinned:
+                LOGGER.info("Pinned mirror %s", winner)
+                self._pinned = winner
+        return self._pinned
+
+    def probe_in_background(self) -> None:
+        if self._probing.locked():
+            return
+        with self._lock:
+            self._probed_at = time.monotonic()
+        threading.Thread(target=self.probe, name="bawang-mirror-probe", daemon=True).start()
+
+    def report_failure(self, url: str) -> bool:
+        if not self.enabled or _netloc(url) != _netloc(self._pinned):
+            return False
+        previous = self._pinned
+        return self.probe() != previous
+
+
+_MIRROR_POOL: Optional[MirrorPool] = None
+_MIRROR_POOL_LOCK = threading.Lock()
+
+
+def get_mirror_pool() -> MirrorPool:
+    global _MIRROR_POOL
+    with _MIRROR_POOL_LOCK:
+        if _MIRROR_POOL is None:
+            _MIRROR_POOL = MirrorPool(config.MIRROR_URLS)
+        return _MIRROR_POOL
+
+
+def base_url() -> str:
+    return get_mirror_pool().pinned
@@ -1,10 +1,23 @@
+import asyncio
+import contextvars
+import functools
 import logging
-from typing import Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import httpx
 
 from bawang import config
+from bawang.utils.cache import CacheEntry, ResponseCache, classify_url, open_response_cache
+from bawang.utils.cookies import get_cookie_jar, save_cookie_jar
+from bawang.utils.deadline import request_timeout
+from bawang.utils.mirrors import base_url, get_mirror_pool
+from bawang.utils.providers import get_provider_history
+from bawang.utils.ratelimit import get_rate_limiter, parse_retry_after
 
 try:
     import requests
@@ -16,9 +29,47 @@ try:
 except ImportError:  # pragma: no cover - optional fallback
     cloudscraper = None
 
+try:
+    import h2
+except ImportError:  # pragma: no cover - optional HTTP/2 support
+    h2 = None
+
 
 LOGGER = logging.getLogger(__name__)
-FALLBACK_STATUSES = {403, 429}
+FALLBACK_STATUSES = {403}
+RATE_LIMIT_STATUS = 429
+NOT_MODIFIED_STATUS = 304
+
+
+@dataclass(frozen=True)
+class TextResponse:
+    text: str
+    status: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class StreamProbe:
+    status: int
+    ttfb: float
+    throughput: Optional[float] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.status < 400
+
+
+def _text_response(response) -> TextResponse:
+    if response.status_code == NOT_MODIFIED_STATUS:
+        return TextResponse(text="", status=NOT_MODIFIED_STATUS)
+    response.raise_for_status()
+    return TextResponse(
+        text=response.text,
+        status=response.status_code,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
 
 
 def build_headers(
@@ -53,119 +104,127 @@ def build_headers(
 def _referer_for(url: str) -> str:
     parsed = urlparse(url)
     if not parsed.scheme or not parsed.netloc:
-        return config.BASE_URL
+        return base_url()
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-class HttpClient:
-    def __init__(self) -> None:
-        self._httpx = httpx.Client(
-            headers=build_headers(),
-            timeout=config.DEFAULT_TIMEOUT,
-            follow_redirects=True,
-        )
+def _httpx_options() -> Dict[str, Any]:
+    http2 = config.HTTP2_ENABLED
+    if http2 and h2 is None:
+        LOGGER.debug("HTTP/2 requested but the h2 package is missing")
+        http2 = False
+    return {
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY,
+        ),
+    }
+
+
+def preconnect_targets() -> List[str]:
+    return [base_url(), *config.PRECONNECT_ORIGINS]
+
+
+class _ProviderAttempts:
+    def __init__(self, kind: str, providers, url: str) -> None:
+        self._kind = kind
+        self._host = urlparse(url).netloc
+        self._history = get_provider_history()
+        if self._history:
+            providers = self._history.order(self._host, providers)
+        self._providers = [(name, call) for name, call in providers if call is not None]
+        self._started = 0.0
+        self._last_error: Optional[Exception] = None
+
+    def __iter__(self):
+        for name, call in self._providers:
+            self._started = time.monotonic()
+            yield name, call
+
+    def _record(self, name: str, ok: bool) -> None:
+        if self._history:
+            self._history.record(self._host, name, ok, time.monotonic() - self._started)
+
+    def succeeded(self, name: str) -> None:
+        self._record(name, True)
+
+    def failed(self, name: str, exc: Exception) -> bool:
+        self._last_error = exc
+        if not _is_retryable(exc):
+            return False
+        self._record(name, False)
+        LOGGER.debug("%s blocked (%s), trying fallback...", self._kind, name)
+        return True
+
+    def exhausted(self) -> None:
+        if self._last_error:
+            raise self._last_error
+        raise RuntimeError("No HTTP client available")
+
+
+class _SyncFallbacks:
+    def _init_fallbacks(self) -> None:
+        self._cookies = get_cookie_jar()
         self._requests = requests.Session() if requests else None
         if self._requests:
             self._requests.headers.update(build_headers())
+            self._requests.cookies = self._cookies
         self._cloudscraper = cloudscraper.create_scraper() if cloudscraper else None
         if self._cloudscraper:
             self._cloudscraper.headers.update(build_headers())
+            self._cloudscraper.cookies = self._cookies
 
-    def __enter__(self) -> "HttpClient":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        self.close()
-
-    def close(self) -> None:
-        self._httpx.close()
+    def _close_fallbacks(self) -> None:
         if self._requests:
             self._requests.close()
         if self._cloudscraper:
             self._cloudscraper.close()
-
-    def get_text(self, url: str, referer: Optional[str] = None) -> str:
-        last_error: Exception | None = None
-        for name, getter in self._providers():
-            if getter is None:
-                continue
-            try:
-                return getter(url, referer)
-            except Exception as exc:  # noqa: BLE001 - surface final error
-                last_error = exc
-                if not _is_retryable(exc):
-                    raise
-                LOGGER.debug("Request blocked (%s), trying fallback...", name)
-        if last_error:
-            raise last_error
-        raise RuntimeError("No HTTP client available")
-
-    def _providers(self):
-        return [
-            ("httpx", self._get_with_httpx),
-            ("cloudscraper", self._get_with_cloudscraper if self._cloudscraper else None),
-            ("requests", self._get_with_requests if self._requests else None),
-        ]
-
-    def post_text(
-        self, url: str, data: Dict[str, str], referer: Optional[str] = None
-    ) -> str:
-        last_error: Exception | None = None
-        for name, poster in self._post_providers():
-            if poster is None:
-                continue
-            try:
-                return poster(url, data, referer)
-            except Exception as exc:  # noqa: BLE001 - surface final error
-                last_error = exc
-                if not _is_retryable(exc):
-                    raise
-                LOGGER.debug("Post blocked (%s), trying fallback...", name)
-        if last_error:
-            raise last_error
-        raise RuntimeError("No HTTP client available")
-
-    def _post_providers(self):
-        return [
-            ("httpx", self._post_with_httpx),
-            ("cloudscraper", self._post_with_cloudscraper if self._cloudscraper else None),
-            ("requests", self._post_with_requests if self._requests else None),
-        ]
-
-    def _get_with_httpx(self, url: str, referer: Optional[str] = None) -> str:
-        headers = build_headers(referer=referer or _referer_for(url))
-        response = self._httpx.get(url, headers=headers)
-        if response.status_code in FALLBACK_STATUSES:
-            self._warm_httpx()
-            response = self._httpx.get(url, headers=headers)
-        response.raise_for_status()
-        return response.text
-
-    def _post_with_httpx(
-        self, url: str, data: Dict[str, str], referer: Optional[str] = None
-    ) -> str:
-        headers = build_headers(referer=referer or _referer_for(url))
-        response = self._httpx.post(url, data=data, headers=headers)
-        if response.status_code in FALLBACK_STATUSES:
-            self._warm_httpx()
-            response = self._httpx.post(url, data=data, headers=headers)
-        response.raise_for_status()
-        return response.text
-
-    def _get_with_requests(self, url: str, referer: Optional[str] = None) -> str:
+        save_cookie_jar(self._cookies)
+
+    def _send(self, method, url: str, **kwargs):
+        host = urlparse(url).netloc
+        limiter = get_rate_limiter()
+        for attempt in range(config.RATE_LIMIT_RETRIES + 1):
+            limiter.acquire(host)
+            kwargs["timeout"] = request_timeout(kwargs.get("timeout"))
+            response = method(url, **kwargs)
+            if response.status_code != RATE_LIMIT_STATUS:
+                limiter.succeeded(host)
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = limiter.throttled(host, retry_after)
+            if attempt < config.RATE_LIMIT_RETRIES:
+                LOGGER.debug("Rate limited by %s, backing off %.1fs", host, delay)
+        return response
+
+    def _get_with_requests(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
         if not self._requests:
             raise RuntimeError("requests not available")
-        headers = build_headers(referer=referer or _referer_for(url))
-        response = self._requests.get(
-            url, headers=headers, timeout=config.DEFAULT_TIMEOUT, allow_redirects=True
+        headers = build_headers(referer=referer or _referer_for(url), extra=validators)
+        response = self._send(
+            self._requests.get,
+            url,
+            headers=headers,
+            timeout=config.DEFAULT_TIMEOUT,
+            allow_redirects=True,
         )
         if response.status_code in FALLBACK_STATUSES:
             self._warm_requests()
-            response = self._requests.get(
-                url, headers=headers, timeout=config.DEFAULT_TIMEOUT, allow_redirects=True
+            response = self._send(
+                self._requests.get,
+                url,
+                headers=headers,
+                timeout=config.DEFAULT_TIMEOUT,
+                allow_redirects=True,
             )
-        response.raise_for_status()
-        return response.text
+        return _text_response(response)
 
     def _post_with_requests(
         self, url: str, data: Dict[str, str], referer: Optional[str] = None
@@ -173,31 +232,49 @@ class HttpClient:
         if not self._requests:
             raise RuntimeError("requests not available")
         headers = build_headers(referer=referer or _referer_for(url))
-        response = self._requests.post(
-            url, data=data, headers=headers, timeout=config.DEFAULT_TIMEOUT
+        response = self._send(
+            self._requests.post,
+            url,
+            data=data,
+            headers=headers,
+            timeout=config.DEFAULT_TIMEOUT,
         )
         if response.status_code in FALLBACK_STATUSES:
             self._warm_requests()
-            response = self._requests.post(
-                url, data=data, headers=headers, timeout=config.DEFAULT_TIMEOUT
+            response = self._send(
+                self._requests.post,
+                url,
+                data=data,
+                headers=headers,
+                timeout=config.DEFAULT_TIMEOUT,
             )
         response.raise_for_status()
         return response.text
 
-    def _get_with_cloudscraper(self, url: str, referer: Optional[str] = None) -> str:
+    def _get_with_cloudscraper(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
         if not self._cloudscraper:
             raise RuntimeError("cloudscraper not available")
-        headers = build_headers(referer=referer or _referer_for(url))
-        response = self._cloudscraper.get(
-            url, headers=headers, timeout=config.DEFAULT_TIMEOUT
+        headers = build_headers(referer=referer or _referer_for(url), extra=validators)
+        response = self._send(
+            self._cloudscraper.get,
+            url,
+            headers=headers,
+            timeout=config.DEFAULT_TIMEOUT,
         )
         if response.status_code in FALLBACK_STATUSES:
             self._warm_cloudscraper()
-            response = self._cloudscraper.get(
-                url, headers=headers, timeout=config.DEFAULT_TIMEOUT
+            response = self._send(
+                self._cloudscraper.get,
+                url,
+                headers=headers,
+                timeout=config.DEFAULT_TIMEOUT,
             )
-        response.raise_for_status()
-        return response.text
+        return _text_response(response)
 
     def _post_with_cloudscraper(
         self, url: str, data: Dict[str, str], referer: Optional[str] = None
@@ -205,29 +282,32 @@ class HttpClient:
         if not self._cloudscraper:
             raise RuntimeError("cloudscraper not available")
         headers = build_headers(referer=referer or _referer_for(url))
-        response = self._cloudscraper.post(
-            url, data=data, headers=headers, timeout=config.DEFAULT_TIMEOUT
+        response = self._send(
+            self._cloudscraper.post,
+            url,
+            data=data,
+            headers=headers,
+            timeout=config.DEFAULT_TIMEOUT,
         )
         if response.status_code in FALLBACK_STATUSES:
             self._warm_cloudscraper()
-            response = self._cloudscraper.post(
-                url, data=data, headers=headers, timeout=config.DEFAULT_TIMEOUT
+            response = self._send(
+                self._cloudscraper.post,
+                url,
+                data=data,
+                headers=headers,
+                timeout=config.DEFAULT_TIMEOUT,
             )
         response.raise_for_status()
         return response.text
 
-    def _warm_httpx(self) -> None:
-        try:
-            self._httpx.get(config.BASE_URL, headers=build_headers())
-        except Exception:
-            return
-
     def _warm_requests(self) -> None:
         if not self._requests:
             return
         try:
-            self._requests.get(
-                config.BASE_URL,
+            self._send(
+                self._requests.get,
+                base_url(),
                 headers=build_headers(),
                 timeout=config.DEFAULT_TIMEOUT,
             )
@@ -238,8 +318,9 @@ class HttpClient:
         if not self._cloudscraper:
             return
         try:
-            self._cloudscraper.get(
-                config.BASE_URL,
+            self._send(
+                self._cloudscraper.get,
+                base_url(),
                 headers=build_headers(),
                 timeout=config.DEFAULT_TIMEOUT,
             )
@@ -247,6 +328,366 @@ class HttpClient:
             return
 
 
+class HttpClient(_SyncFallbacks):
+    def __init__(self, cache: Optional[ResponseCache] = None) -> None:
+        self._init_fallbacks()
+        self._httpx = httpx.Client(
+            headers=build_headers(),
+            cookies=self._cookies,
+            timeout=config.DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            **_httpx_options(),
+        )
+        if cache is None and config.HTTP_CACHE_ENABLED:
+            cache = open_response_cache()
+        self._cache = cache
+        self._revalidating: set = set()
+        self._revalidate_lock = threading.Lock()
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._httpx.close()
+        self._close_fallbacks()
+        if self._cache:
+            self._cache.close()
+        history = get_provider_history()
+        if history:
+            history.save()
+
+    def preconnect(self, urls: Optional[List[str]] = None) -> None:
+        def connect(url: str) -> None:
+            try:
+                self._httpx.head(
+                    url, headers=build_headers(), timeout=config.PRECONNECT_TIMEOUT
+                )
+            except Exception as exc:  # noqa: BLE001 - best effort warm-up
+                LOGGER.debug("Preconnect to %s failed: %s", url, exc)
+
+        for url in urls or preconnect_targets():
+            threading.Thread(
+                target=connect, args=(url,), name="bawang-preconnect", daemon=True
+            ).start()
+
+    def probe_stream(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> StreamProbe:
+        max_bytes = max_bytes or config.PROBE_BYTES
+        timeout = request_timeout(timeout or config.PROBE_TIMEOUT)
+        headers = build_headers(referer=referer, extra={"Range": f"bytes=0-{max_bytes - 1}"})
+        started = time.monotonic()
+        with self._httpx.stream("GET", url, headers=headers, timeout=timeout) as response:
+            ttfb = time.monotonic() - started
+            if response.status_code >= 400:
+                return StreamProbe(status=response.status_code, ttfb=ttfb)
+            received = 0
+            timed_out = False
+            for chunk in response.iter_bytes():
+                received += len(chunk)
+                if received >= max_bytes:
+                    break
+                if time.monotonic() - started >= timeout:
+                    timed_out = True
+                    break
+            elapsed = time.monotonic() - started - ttfb
+        throughput = None
+        if (received >= max_bytes or timed_out) and elapsed > 0:
+            throughput = received / elapsed
+        return StreamProbe(status=response.status_code, ttfb=ttfb, throughput=throughput)
+
+    def get_text(self, url: str, referer: Optional[str] = None) -> str:
+        if not self._cache:
+            return self._fetch(url, referer).text
+        entry = self._cache.lookup(url)
+        if entry and entry.fresh:
+            self._cache.record(entry.url_class, "hit")
+            return entry.body
+        if entry and entry.stale_ok:
+            self._cache.record(entry.url_class, "stale")
+            self._revalidate(url, referer, entry)
+            return entry.body
+        return self._refresh(url, referer, entry)
+
+    def get_if_changed(
+        self,
+        url: str,
+        validators: Optional[Dict[str, str]] = None,
+        referer: Optional[str] = None,
+    ) -> TextResponse:
+        response = self._fetch(url, referer, validators)
+        if self._cache and response.status != NOT_MODIFIED_STATUS:
+            self._cache.store(url, response.text, response.etag, response.last_modified)
+        return response
+
+    def _refresh(self, url: str, referer: Optional[str], entry: Optional[CacheEntry]) -> str:
+        response = self._fetch(url, referer, entry.validators if entry else None)
+        if not self._cache:
+            return response.text
+        if response.status == NOT_MODIFIED_STATUS and entry is not None:
+            self._cache.touch(url)
+            self._cache.record(entry.url_class, "not_modified")
+            return entry.body
+        self._cache.store(url, response.text, response.etag, response.last_modified)
+        self._cache.record(classify_url(url), "miss")
+        return response.text
+
+    def _with_mirror(self, request, url: str, *args):
+        mirrors = get_mirror_pool()
+        target = mirrors.rewrite(url)
+        try:
+            return request(target, *args)
+        except Exception as exc:  # noqa: BLE001 - surface final error
+            if not _is_retryable(exc) or not mirrors.report_failure(target):
+                raise
+            LOGGER.debug("Mirror failed for %s, retrying on %s", url, mirrors.pinned)
+            return request(mirrors.rewrite(url), *args)
+
+    def _revalidate(self, url: str, referer: Optional[str], entry: CacheEntry) -> None:
+        with self._revalidate_lock:
+            if url in self._revalidating:
+                return
+            self._revalidating.add(url)
+
+        def refresh() -> None:
+            try:
+                self._refresh(url, referer, entry)
+            except Exception as exc:  # noqa: BLE001 - background refresh
+                LOGGER.debug("Revalidation failed for %s: %s", url, exc)
+            finally:
+                with self._revalidate_lock:
+                    self._revalidating.discard(url)
+
+        threading.Thread(target=refresh, name="bawang-revalidate", daemon=True).start()
+
+    def _fetch(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
+        return self._with_mirror(self._get_text_once, url, referer, validators)
+
+    def _get_text_once(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
+        return self._try_providers("Request", self._providers(), url, referer, validators)
+
+    def _try_providers(self, kind: str, providers, url: str, *args):
+        attempts = _ProviderAttempts(kind, providers, url)
+        for name, call in attempts:
+            try:
+                result = call(url, *args)
+            except Exception as exc:  # noqa: BLE001 - surface final error
+                if not attempts.failed(name, exc):
+                    raise
+                continue
+            attempts.succeeded(name)
+            return result
+        attempts.exhausted()
+
+    def _providers(self):
+        return [
+            ("httpx", self._get_with_httpx),
+            ("cloudscraper", self._get_with_cloudscraper if self._cloudscraper else None),
+            ("requests", self._get_with_requests if self._requests else None),
+        ]
+
+    def post_text(
+        self, url: str, data: Dict[str, str], referer: Optional[str] = None
+    ) -> str:
+        return self._with_mirror(self._post_text_once, url, data, referer)
+
+    def _post_text_once(
+        self, url: str, data: Dict[str, str], referer: Optional[str] = None
+    ) -> str:
+        return self._try_providers("Post", self._post_providers(), url, data, referer)
+
+    def _post_providers(self):
+        return [
+            ("httpx", self._post_with_httpx),
+            ("cloudscraper", self._post_with_cloudscraper if self._cloudscraper else None),
+            ("requests", self._post_with_requests if self._requests else None),
+        ]
+
+    def _get_with_httpx(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
+        headers = build_headers(referer=referer or _referer_for(url), extra=validators)
+        response = self._send(self._httpx.get, url, headers=headers)
+        if response.status_code in FALLBACK_STATUSES:
+            self._warm_httpx()
+            response = self._send(self._httpx.get, url, headers=headers)
+        return _text_response(response)
+
+    def _post_with_httpx(
+        self, url: str, data: Dict[str, str], referer: Optional[str] = None
+    ) -> str:
+        headers = build_headers(referer=referer or _referer_for(url))
+        response = self._send(self._httpx.post, url, data=data, headers=headers)
+        if response.status_code in FALLBACK_STATUSES:
+            self._warm_httpx()
+            response = self._send(self._httpx.post, url, data=data, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+    def _warm_httpx(self) -> None:
+        try:
+            self._send(self._httpx.get, base_url(), headers=build_headers())
+        except Exception:
+            return
+
+
+class AsyncHttpClient(_SyncFallbacks):
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._init_fallbacks()
+        self._httpx = httpx.AsyncClient(
+            headers=build_headers(),
+            cookies=self._cookies,
+            timeout=config.DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            **_httpx_options(),
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or config.HTTP_FALLBACK_WORKERS,
+            thread_name_prefix="bawang-http",
+        )
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._httpx.aclose()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._close_fallbacks()
+        history = get_provider_history()
+        if history:
+            history.save()
+
+    async def get_text(self, url: str, referer: Optional[str] = None) -> str:
+        url = await self._rewrite(url)
+        response = await self._try_providers("Request", self._providers(), url, referer)
+        return response.text
+
+    async def _try_providers(self, kind: str, providers, url: str, *args):
+        attempts = _ProviderAttempts(kind, providers, url)
+        for name, call in attempts:
+            try:
+                result = await call(url, *args)
+            except Exception as exc:  # noqa: BLE001 - surface final error
+                if not attempts.failed(name, exc):
+                    raise
+                continue
+            attempts.succeeded(name)
+            return result
+        attempts.exhausted()
+
+    def _providers(self):
+        return [
+            ("httpx", self._get_with_httpx),
+            (
+                "cloudscraper",
+                self._threaded(self._get_with_cloudscraper) if self._cloudscraper else None,
+            ),
+            ("requests", self._threaded(self._get_with_requests) if self._requests else None),
+        ]
+
+    async def post_text(
+        self, url: str, data: Dict[str, str], referer: Optional[str] = None
+    ) -> str:
+        url = await self._rewrite(url)
+        return await self._try_providers("Post", self._post_providers(), url, data, referer)
+
+    def _post_providers(self):
+        return [
+            ("httpx", self._post_with_httpx),
+            (
+                "cloudscraper",
+                self._threaded(self._post_with_cloudscraper) if self._cloudscraper else None,
+            ),
+            ("requests", self._threaded(self._post_with_requests) if self._requests else None),
+        ]
+
+    async def _rewrite(self, url: str) -> str:
+        mirrors = get_mirror_pool()
+        if not mirrors.enabled:
+            return url
+        return await self._threaded(mirrors.rewrite)(url)
+
+    async def _asend(self, method, url: str, **kwargs):
+        host = urlparse(url).netloc
+        limiter = get_rate_limiter()
+        for attempt in range(config.RATE_LIMIT_RETRIES + 1):
+            delay = limiter.reserve(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            kwargs["timeout"] = request_timeout(kwargs.get("timeout"))
+            response = await method(url, **kwargs)
+            if response.status_code != RATE_LIMIT_STATUS:
+                limiter.succeeded(host)
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = limiter.throttled(host, retry_after)
+            if attempt < config.RATE_LIMIT_RETRIES:
+                LOGGER.debug("Rate limited by %s, backing off %.1fs", host, delay)
+        return response
+
+    def _threaded(self, func):
+        async def runner(*args):
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            call = functools.partial(context.run, func, *args)
+            return await loop.run_in_executor(self._executor, call)
+
+        return runner
+
+    async def _get_with_httpx(
+        self,
+        url: str,
+        referer: Optional[str] = None,
+        validators: Optional[Dict[str, str]] = None,
+    ) -> TextResponse:
+        headers = build_headers(referer=referer or _referer_for(url), extra=validators)
+        response = await self._asend(self._httpx.get, url, headers=headers)
+        if response.status_code in FALLBACK_STATUSES:
+            await self._warm_httpx()
+            response = await self._asend(self._httpx.get, url, headers=headers)
+        return _text_response(response)
+
+    async def _post_with_httpx(
+        self, url: str, data: Dict[str, str], referer: Optional[str] = None
+    ) -> str:
+        headers = build_headers(referer=referer or _referer_for(url))
+        response = await self._asend(self._httpx.post, url, data=data, headers=headers)
+        if response.status_code in FALLBACK_STATUSES:
+            await self._warm_httpx()
+            response = await self._asend(self._httpx.post, url, data=data, headers=headers)
+        response.raise_for_status()
+        return response.text
+
+    async def _warm_httpx(self) -> None:
+        try:
+            await self._asend(self._httpx.get, base_url(), headers=build_headers())
+        except Exception:
+            return
+
+
 def _is_retryable(exc: Exception) -> bool:
     status = _status_from_exception(exc)
     if status is not None:
@@ -272,6 +713,10 @@ def get_client() -> HttpClient:
     return HttpClient()
 
 
+def get_async_client() -> AsyncHttpClient:
+    return AsyncHttpClient()
+
+
 def fetch_text(client, url: str, referer: Optional[str] = None) -> str:
     if hasattr(client, "get_text"):
         return client.get_text(url, referer=referer)
@@ -281,6 +726,17 @@ def fetch_text(client, url: str, referer: Optional[str] = None) -> str:
     return response.text
 
 
+def fetch_if_changed(
+    client,
+    url: str,
+    validators: Optional[Dict[str, str]] = None,
+    referer: Optional[str] = None,
+) -> TextResponse:
+    if hasattr(client, "get_if_changed"):
+        return client.get_if_changed(url, validators=validators, referer=referer)
+    return TextResponse(text=fetch_text(client, url, referer=referer), status=200)
+
+
 def post_text(
     client, url: str, data: Dict[str, str], referer: Optional[str] = None
 ) -> str:
@@ -290,3 +746,23 @@ def post_text(
     response = client.post(url, data=data, headers=headers)
     response.raise_for_status()
     return response.text
+
+
+async def fetch_text_async(client, url: str, referer: Optional[str] = None) -> str:
+    if hasattr(client, "get_text"):
+        return await client.get_text(url, referer=referer)
+    headers = build_headers(referer=referer or _referer_for(url))
+    response = await client.get(url, headers=headers)
+    response.raise_for_status()
+    return response.text
+
+
+async def post_text_async(
+    client, url: str, data: Dict[str, str], referer: Optional[str] = None
+) -> str:
+    if hasattr(client, "post_text"):
+        return await client.post_text(url, data, referer=referer)
+    headers = build_headers(referer=referer or _referer_for(url))
+    response = await client.post(url, data=data, headers=headers)
+    response.raise_for_status()
+    return response.text
@@ -0,0 +1,121 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from bawang import config
+
+
+LOGGER = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+@dataclass
+class ProviderStats:
+    successes: float = 0.0
+    failures: float = 0.0
+    latency: float = 0.0
+    updated_at: float = 0.0
+
+    @property
+    def success_rate(self) -> float:
+        return (self.successes + 1.0) / (self.successes + self.failures + 2.0)
+
+
+class ProviderHistory:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._path = path
+        self._stats: Dict[str, Dict[str, ProviderStats]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self._load(path)
+
+    def record(self, host: str, provider: str, ok: bool, latency: float) -> None:
+        host = host.lower()
+        with self._lock:
+            stats = self._stats.setdefault(host, {}).setdefault(provider, ProviderStats())
+            stats.successes *= config.PROVIDER_HISTORY_DECAY
+            stats.failures *= config.PROVIDER_HISTORY_DECAY
+            if ok:
+                stats.successes += 1.0
+                if stats.latency:
+                    stats.latency = 0.7 * stats.latency + 0.3 * latency
+                else:
+                    stats.latency = latency
+            else:
+                stats.failures += 1.0
+            stats.updated_at = time.time()
+            self._dirty = True
+
+    def order(self, host: str, providers: Sequence[Tuple[str, T]]) -> List[Tuple[str, T]]:
+        with self._lock:
+            known = dict(self._stats.get(host.lower(), {}))
+        if not known:
+            return list(providers)
+
+        def rank(item: Tuple[int, Tuple[str, T]]):
+            index, (name, _) = item
+            stats = known.get(name)
+            if stats is None:
+                return (-0.5, 0.0, index)
+            return (-round(stats.success_rate, 2), stats.latency, index)
+
+        return [item for _, item in sorted(enumerate(providers), key=rank)]
+
+    def save(self) -> None:
+        if not self._path or not self._dirty:
+            return
+        with self._lock:
+            payload = {
+                host: {name: asdict(stats) for name, stats in providers.items()}
+                for host, providers in self._stats.items()
+            }
+            self._dirty = False
+        try:
+            tmp_path = self._path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            os.replace(tmp_path, self._path)
+        except OSError as exc:
+            LOGGER.debug("Could not save provider history: %s", exc)
+
+    def _load(self, path: str) -> None:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        cutoff = time.time() - config.PROVIDER_HISTORY_MAX_AGE
+        for host, providers in payload.items():
+            for name, values in providers.items():
+                try:
+                    stats = ProviderStats(**values)
+                except TypeError:
+                    continue
+                if stats.updated_at < cutoff:
+                    continue
+                self._stats.setdefault(host, {})[name] = stats
+
+
+_PROVIDER_HISTORY: Optional[ProviderHistory] = None
+_PROVIDER_HISTORY_LOCK = threading.Lock()
+
+
+def get_provider_history() -> Optional[ProviderHistory]:
+    global _PROVIDER_HISTORY
+    if not config.PROVIDER_HISTORY_ENABLED:
+        return None
+    with _PROVIDER_HISTORY_LOCK:
+        if _PROVIDER_HISTORY is None:
+            path = None
+            try:
+                os.makedirs(config.CACHE_DIR, exist_ok=True)
+                path = os.path.join(config.CACHE_DIR, "providers.json")
+            except OSError as exc:
+                LOGGER.debug("Provider history directory unavailable: %s", exc)
+            _PROVIDER_HISTORY = ProviderHistory(path)
+        return _PROVIDER_HISTORY
@@ -0,0 +1,114 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+from bawang import config
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    strikes: int = 0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float = config.RATE_LIMIT_PER_SECOND,
+        burst: int = config.RATE_LIMIT_BURST,
+        host_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self._rate = rate
+        self._burst = max(1, burst)
+        self._host_rates = host_rates if host_rates is not None else config.RATE_LIMIT_HOSTS
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate = self._host_rates.get(host, self._rate)
+            bucket = _Bucket(
+                rate=rate,
+                capacity=float(self._burst),
+                tokens=float(self._burst),
+                updated=now,
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    def reserve(self, host: str) -> float:
+        host = host.lower()
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now)
+            delay = max(0.0, bucket.blocked_until - now)
+            if bucket.rate <= 0:
+                return delay
+            refill = (now - bucket.updated) * bucket.rate
+            bucket.tokens = min(bucket.capacity, bucket.tokens + refill)
+            bucket.updated = now
+            bucket.tokens -= 1.0
+            if bucket.tokens < 0:
+                delay = max(delay, -bucket.tokens / bucket.rate)
+            return delay
+
+    def acquire(self, host: str) -> None:
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    def throttled(self, host: str, retry_after: Optional[float] = None) -> float:
+        host = host.lower()
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(host, now)
+            bucket.strikes += 1
+            backoff = config.RATE_LIMIT_BACKOFF_BASE * (2 ** (bucket.strikes - 1))
+            backoff = min(config.RATE_LIMIT_BACKOFF_MAX, backoff)
+            delay = backoff * random.uniform(0.5, 1.0)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, config.RATE_LIMIT_BACKOFF_MAX))
+            bucket.blocked_until = max(bucket.blocked_until, now + delay)
+            bucket.tokens = min(bucket.tokens, 0.0)
+            return delay
+
+    def succeeded(self, host: str) -> None:
+        with self._lock:
+            bucket = self._buckets.get(host.lower())
+            if bucket is not None:
+                bucket.strikes = 0
+
+
+_RATE_LIMITER: Optional[RateLimiter] = None
+_RATE_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    global _RATE_LIMITER
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None:
+            _RATE_LIMITER = RateLimiter()
+        return _RATE_LIMITER
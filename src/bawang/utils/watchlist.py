@@ -0,0 +1,159 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass, field, replace
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from bawang import config
+from bawang.models import Episode
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ShowState:
+    anime_url: str
+    title: str
+    episodes: List[Episode] = field(default_factory=list)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0
+    followed: bool = False
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def title_from_url(anime_url: str) -> str:
+    slug = urlparse(anime_url).path.rstrip("/").rsplit("/", 1)[-1]
+    return slug.replace("-", " ").title() or anime_url
+
+
+class Watchlist:
+    def __init__(self, path: Optional[str] = None) -> None:
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            self._conn = sqlite3.connect(path or ":memory:", check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS shows ("
+                "anime_url TEXT PRIMARY KEY, title TEXT NOT NULL, episodes TEXT NOT NULL, "
+                "etag TEXT, last_modified TEXT, checked_at REAL NOT NULL, "
+                "followed INTEGER NOT NULL DEFAULT 0)"
+            )
+            self._conn.commit()
+        except sqlite3.Error as exc:
+            LOGGER.debug("Watchlist store unavailable: %s", exc)
+            self._conn = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _state(self, row) -> ShowState:
+        anime_url, title, payload, etag, last_modified, checked_at, followed = row
+        try:
+            episodes = [Episode(**item) for item in json.loads(payload)]
+        except (TypeError, ValueError):
+            episodes = []
+        return ShowState(
+            anime_url=anime_url,
+            title=title,
+            episodes=episodes,
+            etag=etag,
+            last_modified=last_modified,
+            checked_at=checked_at,
+            followed=bool(followed),
+        )
+
+    def get(self, anime_url: str) -> Optional[ShowState]:
+        with self._lock:
+            if not self._conn:
+                return None
+            row = self._conn.execute(
+                "SELECT anime_url, title, episodes, etag, last_modified, checked_at, followed "
+                "FROM shows WHERE anime_url = ?",
+                (anime_url,),
+            ).fetchone()
+        return self._state(row) if row else None
+
+    def save(self, state: ShowState) -> None:
+        payload = json.dumps([asdict(item) for item in state.episodes])
+        with self._lock:
+            if not self._conn:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO shows "
+                "(anime_url, title, episodes, etag, last_modified, checked_at, followed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    state.anime_url,
+                    state.title,
+                    payload,
+                    state.etag,
+                    state.last_modified,
+                    state.checked_at,
+                    int(state.followed),
+                ),
+            )
+            self._conn.commit()
+
+    def follow(self, anime_url: str, title: Optional[str] = None) -> ShowState:
+        state = self.get(anime_url)
+        if state is None:
+            state = ShowState(anime_url=anime_url, title=title or title_from_url(anime_url))
+        state = replace(state, title=title or state.title, followed=True)
+        self.save(state)
+        return state
+
+    def unfollow(self, anime_url: str) -> bool:
+        with self._lock:
+            if not self._conn:
+                return False
+            cursor = self._conn.execute(
+                "UPDATE shows SET followed = 0 WHERE anime_url = ? AND followed = 1",
+                (anime_url,),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def followed(self) -> List[ShowState]:
+        with self._lock:
+            if not self._conn:
+                return []
+            rows = self._conn.execute(
+                "SELECT anime_url, title, episodes, etag, last_modified, checked_at, followed "
+                "FROM shows WHERE followed = 1 ORDER BY title"
+            ).fetchall()
+        return [self._state(row) for row in rows]
+
+
+_WATCHLIST: Optional[Watchlist] = None
+_WATCHLIST_LOCK = threading.Lock()
+
+
+def get_watchlist() -> Watchlist:
+    global _WATCHLIST
+    with _WATCHLIST_LOCK:
+        if _WATCHLIST is None:
+            path = None
+            try:
+                os.makedirs(config.DATA_DIR, exist_ok=True)
+                path = os.path.join(config.DATA_DIR, "watchlist.sqlite3")
+            except OSError as exc:
+                LOGGER.debug("Watchlist directory unavailable: %s", exc)
+            _WATCHLIST = Watchlist(path)
+        return _WATCHLIST
+
@@ -0,0 +1,13 @@
+import pytest
+
+from bawang import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setattr(config, "HTTP_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "STREAM_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "COOKIE_JAR_ENABLED", False)
+    monkeypatch.setattr(config, "PROVIDER_HISTORY_ENABLED", False)
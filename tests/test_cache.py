@@ -0,0 +1,90 @@
+import pytest
+
+from bawang.utils import cache as cache_module
+from bawang.utils.cache import ResponseCache, classify_url
+
+SITE = "https://v1.samehadaku.how"
+ANIME_URL = f"{SITE}/anime/frieren/"
+EPISODE_URL = f"{SITE}/frieren-episode-1/"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+def _cache(tmp_path, **kwargs) -> ResponseCache:
+    kwargs.setdefault("ttls", {"anime": 60, "episode": 60, "embed": 0})
+    kwargs.setdefault("stale", {"anime": 0, "episode": 120})
+    return ResponseCache(str(tmp_path / "http.sqlite3"), **kwargs)
+
+
+def test_classify_url():
+    assert classify_url(f"{SITE}/?s=frieren") == "search"
+    assert classify_url(ANIME_URL) == "anime"
+    assert classify_url(EPISODE_URL) == "episode"
+    assert classify_url("https://wibufile.com/embed/1") == "embed"
+    assert classify_url(f"{SITE}/jadwal-rilis/") is None
+
+
+def test_fresh_stale_and_expired(tmp_path, clock):
+    store = _cache(tmp_path)
+    store.store(EPISODE_URL, "<html>1</html>", etag='"v1"')
+
+    clock.now += 30
+    entry = store.lookup(EPISODE_URL)
+    assert (entry.body, entry.fresh, entry.stale_ok) == ("<html>1</html>", True, True)
+    assert entry.validators == {"If-None-Match": '"v1"'}
+
+    clock.now += 60
+    entry = store.lookup(EPISODE_URL)
+    assert (entry.fresh, entry.stale_ok) == (False, True)
+
+    clock.now += 120
+    assert store.lookup(EPISODE_URL).stale_ok is False
+
+
+def test_no_stale_window_and_touch(tmp_path, clock):
+    store = _cache(tmp_path)
+    store.store(ANIME_URL, "<html></html>")
+    clock.now += 61
+    entry = store.lookup(ANIME_URL)
+    assert (entry.fresh, entry.stale_ok) == (False, False)
+
+    store.touch(ANIME_URL)
+    assert store.lookup(ANIME_URL).fresh
+
+
+def test_uncacheable_classes_are_not_stored(tmp_path, clock):
+    store = _cache(tmp_path)
+    store.store("https://wibufile.com/embed/1", "<html></html>")
+    store.store(f"{SITE}/jadwal-rilis/", "<html></html>")
+    assert store.lookup("https://wibufile.com/embed/1") is None
+    assert store.lookup(f"{SITE}/jadwal-rilis/") is None
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    urls = [f"{SITE}/show-episode-{index}/" for index in range(3)]
+    body = "<html>" + "".join(f"<p>{index}</p>" for index in range(200)) + "</html>"
+    size = len(cache_module.zlib.compress(body.encode("utf-8")))
+    store = _cache(tmp_path, max_bytes=size * 2)
+    for url in urls[:2]:
+        store.store(url, body)
+        clock.now += 1
+    assert store.lookup(urls[0]) is not None
+    clock.now += 1
+    store.store(urls[2], body)
+
+    assert store.lookup(urls[1]) is None
+    assert store.lookup(urls[0]) is not None
+    assert store.lookup(urls[2]) is not None
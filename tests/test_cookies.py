@@ -0,0 +1,37 @@
+import os
+import stat
+from http.cookiejar import Cookie
+
+import pytest
+
+from bawang.utils.cookies import load_cookie_jar, save_cookie_jar
+
+
+def _cookie(name: str, value: str) -> Cookie:
+    return Cookie(
+        0, name, value, None, False, "example.com", False, False, "/", True,
+        True, None, False, None, None, {},
+    )
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_cookie_file_is_never_readable_by_others(tmp_path, monkeypatch):
+    path = str(tmp_path / "cookies.txt")
+    modes = []
+    jar = load_cookie_jar(path)
+    save = type(jar).save
+
+    def spy(self, *args, **kwargs):
+        modes.append(stat.S_IMODE(os.stat(path).st_mode))
+        return save(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(jar), "save", spy)
+    old = os.umask(0o022)
+    try:
+        jar.set_cookie(_cookie("cf_clearance", "secret"))
+        save_cookie_jar(jar)
+    finally:
+        os.umask(old)
+    assert modes == [0o600]
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert [cookie.value for cookie in load_cookie_jar(path)] == ["secret"]
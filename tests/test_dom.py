@@ -0,0 +1,62 @@
+import pytest
+
+from bawang.scraper.episodes import parse_episodes
+from bawang.scraper.search import CARD_SELECTORS, parse_result_page
+from bawang.utils.dom import available_backends, parse_html
+
+SEARCH_PAGE = """
+<html><body>
+<div class="sidebar"><a href="/tag/x/">Tag</a></div>
+<div class="animepost post-1"><a href="/anime/naruto/" title="Naruto"><h2>Naruto</h2></a></div>
+<div class="bs"><a href="/anime/bleach/" title="Bleach"><h2>Bleach</h2></a></div>
+</body></html>
+"""
+
+EPISODE_PAGE = """
+<html><body>
+<div class="episodelist clearfix"><ul>
+<li><a href="https://example.com/show-episode-1/">Show Episode 1</a></li>
+</ul></div>
+<div class="eps"><a href="https://example.com/show-episode-2/">Show Episode 2</a></div>
+</body></html>
+"""
+
+
+@pytest.fixture(params=available_backends())
+def backend(request, monkeypatch):
+    monkeypatch.setattr("bawang.scraper.common.parse_html", _with_backend(request.param))
+    return request.param
+
+
+def _with_backend(name):
+    def parse(html, backend=None, only=None):
+        return parse_html(html, backend=name, only=only)
+
+    return parse
+
+
+def _hrefs(node, selectors):
+    return sorted(
+        anchor.get("href") for selector in selectors for anchor in node.select(selector + " a")
+    )
+
+
+@pytest.mark.parametrize(
+    "html, selectors",
+    [(SEARCH_PAGE, CARD_SELECTORS), (EPISODE_PAGE, ["div.episodelist", "div.eps"])],
+)
+def test_strained_parse_matches_full_parse(html, selectors):
+    for name in available_backends():
+        strained = parse_html(html, backend=name, only=selectors)
+        full = parse_html(html, backend=name)
+        assert _hrefs(strained, selectors) == _hrefs(full, selectors)
+
+
+def test_search_keeps_multi_class_cards(backend):
+    titles = sorted(result.title for result in parse_result_page(SEARCH_PAGE))
+    assert titles == ["Bleach", "Naruto"]
+
+
+def test_episodes_keep_multi_class_lists(backend):
+    titles = [episode.title for episode in parse_episodes(EPISODE_PAGE)]
+    assert titles == ["Show Episode 2", "Show Episode 1"]
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from bawang.resolver.heuristics import (
+    MediaMatch,
+    extract_media_from_html,
+    extract_media_urls_from_html,
+    scan_media,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BASE_URL = "https://embed.example.com/e/1"
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_json_escaped_and_protocol_relative_sources():
+    assert extract_media_from_html(fixture("player_json.html"), BASE_URL) == [
+        MediaMatch("https://cdn.example.com/v/ep1-480.mp4?token=a&exp=1", "480p"),
+        MediaMatch("https://cdn.example.com/v/ep1_hd.mp4", "720p"),
+        MediaMatch("https://cdn.example.com/v/ep1-1080p.m3u8", "1080p"),
+    ]
+
+
+def test_html_entities_in_tag_sources():
+    assert extract_media_urls_from_html(fixture("player_html.html"), BASE_URL) == [
+        "https://media.example.com/stream/ep2.mp4?a=1&b=2",
+        "https://embed.example.com/e/ep2-720p.m3u8",
+    ]
+
+
+def test_match_does_not_run_into_the_next_url():
+    for text in (
+        "load('//a.com/1.js,//b.com/2.mp4')",
+        '"https:\\/\\/a.com\\/1.js,https:\\/\\/b.com\\/2.mp4"',
+    ):
+        assert [item.url for item in scan_media(text, BASE_URL)] == ["https://b.com/2.mp4"]
+
+
+def test_double_slash_inside_a_path_is_kept():
+    text = '<video src="https://cdn.example.com/v//ep1.mp4"></video>'
+    assert extract_media_urls_from_html(text, BASE_URL) == ["https://cdn.example.com/v//ep1.mp4"]
+
+
+def test_double_slash_inside_a_query_is_kept():
+    text = "file: 'https://cdn.example.com/videos/a.mp4?x=//y'"
+    assert [item.url for item in scan_media(text, BASE_URL)] == [
+        "https://cdn.example.com/videos/a.mp4?x=//y"
+    ]
+
+
+def test_quality_hint_outside_window_is_ignored():
+    text = "720p" + " " * 50 + "//cdn.example.com/a.mp4"
+    assert next(scan_media(text, BASE_URL, window=20)).quality is None
+    assert next(scan_media(text, BASE_URL, window=60)).quality == "720p"
+
+
+def test_quality_hint_is_not_shared_between_urls():
+    text = "//cdn.example.com/a.mp4 1080p //cdn.example.com/b.mp4"
+    assert [item.quality for item in scan_media(text, BASE_URL)] == ["1080p", None]
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from bawang.models import QualityOption
+from bawang.resolver.hls import is_hls, parse_attributes, parse_master_playlist
+
+FIXTURES = Path(__file__).parent / "fixtures"
+PLAYLIST_URL = "https://cdn.example.com/hls/ep1/master.m3u8"
+
+
+def test_is_hls():
+    assert is_hls("https://cdn.example.com/a/master.M3U8?token=1")
+    assert not is_hls("https://cdn.example.com/a/video.mp4?next=x.m3u8")
+
+
+def test_parse_attributes_keeps_quoted_commas():
+    attributes = parse_attributes(
+        'BANDWIDTH=800000,CODECS="avc1.4d401e,mp4a.40.2",RESOLUTION=640x360'
+    )
+    assert attributes == {
+        "BANDWIDTH": "800000",
+        "CODECS": "avc1.4d401e,mp4a.40.2",
+        "RESOLUTION": "640x360",
+    }
+
+
+def test_parse_master_playlist():
+    text = (FIXTURES / "master.m3u8").read_text(encoding="utf-8")
+    assert parse_master_playlist(text, PLAYLIST_URL) == [
+        QualityOption(
+            label="720p",
+            url="https://cdn.example.com/hls/ep1/720/index.m3u8",
+            resolution="1280x720",
+            bandwidth=2500000,
+        ),
+        QualityOption(
+            label="360p",
+            url="https://cdn2.example.com/hls/360/index.m3u8?token=abc",
+            resolution="640x360",
+            bandwidth=800000,
+        ),
+        QualityOption(
+            label="96 kbps",
+            url="https://cdn.example.com/hls/ep1/audio/index.m3u8",
+            bandwidth=96000,
+        ),
+    ]
+
+
+def test_media_playlist_has_no_variants():
+    text = "#EXTM3U\n#EXTINF:10.0,\nsegment0.ts\n#EXTINF:10.0,\nsegment1.ts\n#EXT-X-ENDLIST\n"
+    assert parse_master_playlist(text, PLAYLIST_URL) == []
@@ -0,0 +1,34 @@
+import pytest
+
+from bawang.resolver import hosts
+from bawang.resolver.hosts import register_host, resolve_embed
+from bawang.resolver.hosts.base import HostPlugin
+
+EMBED_URL = "https://broken.example/e/1"
+EMBED_HTML = '<video><source src="https://broken.example/v/ep1-720p.mp4"></video>'
+
+
+class FakeClient:
+    def get_text(self, url, referer=None):
+        return EMBED_HTML
+
+
+def _raise(*args):
+    raise ValueError("plugin bug")
+
+
+@pytest.fixture
+def broken_plugin(monkeypatch):
+    monkeypatch.setattr(hosts, "_EXTRA_HOSTS", [])
+    monkeypatch.setattr(hosts, "_ENTRY_POINTS_LOADED", True)
+    return lambda **hooks: register_host(
+        HostPlugin(name="broken", domains=("broken.example",), **hooks)
+    )
+
+
+@pytest.mark.parametrize("hook", ["extract", "from_url"])
+def test_broken_plugin_falls_back_to_generic_extraction(broken_plugin, hook):
+    broken_plugin(**{hook: _raise})
+    assert resolve_embed(FakeClient(), EMBED_URL, "https://v1.samehadaku.how/") == [
+        "https://broken.example/v/ep1-720p.mp4"
+    ]
@@ -0,0 +1,30 @@
+import threading
+import time
+
+from bawang.utils.mirrors import MirrorPool
+
+MIRRORS = ["https://a.example", "https://b.example"]
+
+
+def test_concurrent_first_callers_share_one_probe():
+    calls = []
+    lock = threading.Lock()
+
+    def probe(mirror):
+        with lock:
+            calls.append(mirror)
+        time.sleep(0.2 if mirror == MIRRORS[0] else 0.05)
+        return 0.1
+
+    pool = MirrorPool(MIRRORS, probe=probe)
+    threads = [
+        threading.Thread(target=pool.rewrite, args=(f"{MIRRORS[0]}/anime/{index}/",))
+        for index in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert sorted(calls) == MIRRORS
+    assert pool.pinned == MIRRORS[1]
+    assert pool.rewrite(f"{MIRRORS[0]}/anime/1/") == f"{MIRRORS[1]}/anime/1/"
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+from bawang.resolver.hosts import find_host
+from bawang.utils import net
+from bawang.utils.deadline import Deadline, current_deadline, deadline_scope
+from bawang.utils.net import AsyncHttpClient, HttpClient
+from bawang.utils.providers import ProviderHistory
+
+URL = "https://example.com/page"
+
+
+def test_threaded_fallback_sees_current_deadline():
+    deadline = Deadline(5)
+
+    async def run():
+        async with AsyncHttpClient(max_workers=1) as client:
+            with deadline_scope(deadline):
+                return await client._threaded(current_deadline)()
+
+    assert asyncio.run(run()) is deadline
+
+
+def test_preconnect_targets_are_fetched_origins():
+    targets = net.preconnect_targets()
+    assert targets[0] == net.base_url()
+    for origin in targets[1:]:
+        plugin = find_host(origin)
+        assert plugin is not None and plugin.extract is not None
+
+
+def _blocked(url):
+    raise httpx.ConnectError("blocked")
+
+
+def test_providers_fall_back_and_reorder_by_history(monkeypatch):
+    history = ProviderHistory()
+    monkeypatch.setattr(net, "get_provider_history", lambda: history)
+    tried = []
+
+    def ok(url):
+        tried.append("requests")
+        return "sync"
+
+    async def blocked_async(url):
+        tried.append("httpx")
+        _blocked(url)
+
+    async def ok_async(url):
+        tried.append("requests")
+        return "async"
+
+    providers = [("httpx", _blocked), ("cloudscraper", None), ("requests", ok)]
+    with HttpClient() as client:
+        assert client._try_providers("Request", providers, URL) == "sync"
+
+    async def run():
+        async with AsyncHttpClient(max_workers=1) as client:
+            providers = [("httpx", blocked_async), ("requests", ok_async)]
+            return await client._try_providers("Request", providers, URL)
+
+    assert asyncio.run(run()) == "async"
+    assert tried == ["requests", "requests"]
+
+
+def test_providers_raise_non_retryable_and_last_errors(monkeypatch):
+    monkeypatch.setattr(net, "get_provider_history", lambda: None)
+
+    def broken(url):
+        raise ValueError("parse error")
+
+    with HttpClient() as client:
+        with pytest.raises(ValueError):
+            client._try_providers("Request", [("httpx", broken), ("requests", _blocked)], URL)
+        with pytest.raises(httpx.ConnectError):
+            client._try_providers("Request", [("httpx", _blocked)], URL)
+        with pytest.raises(RuntimeError):
+            client._try_providers("Request", [("httpx", None)], URL)
@@ -0,0 +1,47 @@
+import threading
+
+from bawang.models import Episode, ResolveResult
+from bawang.tui import prefetch
+from bawang.tui.prefetch import Prefetcher
+
+
+EPISODE = Episode(title="Episode 1", url="https://example.com/episode-1/")
+
+
+def test_prefetched_links_does_not_wait_for_running_resolve(monkeypatch):
+    release = threading.Event()
+    result = ResolveResult(options=[], partial=False)
+
+    def slow_resolve(client, episode_url, **kwargs):
+        release.wait(5)
+        return result
+
+    monkeypatch.setattr(prefetch, "resolve_links", slow_resolve)
+    with Prefetcher(client=None, workers=1) as prefetcher:
+        prefetcher.prefetch_links([EPISODE])
+        assert prefetcher.prefetched_links(EPISODE.url) is None
+        release.set()
+        prefetcher._links[EPISODE.url].result(5)
+        assert prefetcher.prefetched_links(EPISODE.url) is result
+        assert prefetcher.prefetched_links(EPISODE.url) is None
+
+
+def test_cancel_interrupts_running_link_prefetch(monkeypatch):
+    seen = []
+    started = threading.Event()
+
+    def blocking_resolve(client, episode_url, cancel=None, **kwargs):
+        seen.append(cancel)
+        started.set()
+        cancel.wait(5)
+        return ResolveResult(options=[], partial=True)
+
+    monkeypatch.setattr(prefetch, "resolve_links", blocking_resolve)
+    with Prefetcher(client=None, workers=1) as prefetcher:
+        prefetcher.prefetch_links([EPISODE])
+        future = prefetcher._links[EPISODE.url]
+        assert started.wait(5)
+        prefetcher.cancel()
+        assert future.result(1).partial
+        assert seen[0].is_set()
+        assert prefetcher.prefetched_links(EPISODE.url) is None
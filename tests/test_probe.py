@@ -0,0 +1,53 @@
+import time
+
+import httpx
+
+from bawang.models import QualityOption
+from bawang.resolver.probe import is_slow, probe_options
+from bawang.utils.net import HttpClient
+
+
+def _client(handler) -> HttpClient:
+    client = HttpClient()
+    client._httpx.close()
+    client._httpx = httpx.Client(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _trickle():
+    for _ in range(100):
+        time.sleep(0.02)
+        yield b"x" * 400
+
+
+def test_slow_stream_reports_throughput():
+    client = _client(lambda request: httpx.Response(206, content=_trickle()))
+    try:
+        probe = client.probe_stream("https://cdn.example.com/a.mp4", timeout=0.3)
+    finally:
+        client.close()
+    assert probe.alive
+    assert probe.throughput is not None
+    assert probe.throughput < 64 * 1024
+
+
+def test_slow_links_rank_below_fast_links():
+    def handler(request):
+        if "slow" in request.url.path:
+            return httpx.Response(206, content=_trickle())
+        if "gone" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(206, content=b"x" * 1024)
+
+    client = _client(handler)
+    options = [
+        QualityOption("1080p", "https://cdn.example.com/slow.mp4"),
+        QualityOption("720p", "https://cdn.example.com/fast.mp4"),
+        QualityOption("480p", "https://cdn.example.com/gone.mp4"),
+    ]
+    try:
+        ranked = probe_options(client, options, workers=1, timeout=0.3)
+    finally:
+        client.close()
+    assert [option.label for option in ranked] == ["720p", "1080p", "480p"]
+    assert is_slow(ranked[1])
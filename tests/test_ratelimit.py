@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from bawang.utils import ratelimit
+from bawang.utils.ratelimit import RateLimiter, parse_retry_after
+
+HOST = "v1.samehadaku.how"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    monkeypatch.setattr(ratelimit.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(ratelimit.config, "RATE_LIMIT_BACKOFF_BASE", 1.0)
+    monkeypatch.setattr(ratelimit.config, "RATE_LIMIT_BACKOFF_MAX", 8.0)
+    return clock
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after(" 12 ") == 12.0
+    assert parse_retry_after("soon") is None
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(minutes=5)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_burst_then_steady_rate(clock):
+    limiter = RateLimiter(rate=2.0, burst=2, host_rates={})
+    assert [limiter.reserve(HOST) for _ in range(2)] == [0.0, 0.0]
+    assert limiter.reserve(HOST) == pytest.approx(0.5)
+    clock.now += 1.0
+    assert limiter.reserve(HOST) == 0.0
+
+
+def test_host_override_and_unlimited_hosts(clock):
+    limiter = RateLimiter(rate=1.0, burst=1, host_rates={"cdn.example": 0})
+    assert [limiter.reserve("CDN.example") for _ in range(5)] == [0.0] * 5
+    assert limiter.reserve(HOST) == 0.0
+    assert limiter.reserve(HOST) == pytest.approx(1.0)
+
+
+def test_throttled_backs_off_exponentially_until_success(clock):
+    limiter = RateLimiter(rate=0, burst=1, host_rates={})
+    assert [limiter.throttled(HOST) for _ in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+    assert limiter.reserve(HOST) == pytest.approx(8.0)
+    limiter.succeeded(HOST)
+    clock.now += 10
+    assert limiter.reserve(HOST) == 0.0
+    assert limiter.throttled(HOST) == 1.0
+
+
+def test_retry_after_raises_delay_up_to_cap(clock):
+    limiter = RateLimiter(rate=0, burst=1, host_rates={})
+    assert limiter.throttled(HOST, retry_after=5.0) == 5.0
+    assert limiter.throttled(HOST, retry_after=120.0) == 8.0
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from bawang.resolver import resolve
+from bawang.resolver.cache import StreamCache
+from bawang.resolver.resolve import ResolvePolicy, iter_video_links, resolve_links
+from bawang.utils.deadline import request_timeout
+
+EPISODE_URL = "https://v1.samehadaku.how/show-episode-1/"
+PAGES = {
+    EPISODE_URL: """
+        <html><body>
+        <iframe src="https://wibufile.com/embed/1"></iframe>
+        <div data-video="https://filedon.co/e/2"></div>
+        </body></html>
+    """,
+    "https://wibufile.com/embed/1": '<video><source src="https://wibufile.com/f/1080p.mp4">',
+    "https://filedon.co/e/2": '<video src="https://filedon.co/s/ep1.mp4"></video>',
+}
+POLICY = ResolvePolicy(min_host_score=1, min_quality=1080)
+
+
+class FakeClient:
+    def get_text(self, url, referer=None):
+        if url not in PAGES:
+            raise RuntimeError(f"404 {url}")
+        return PAGES[url]
+
+    def post_text(self, url, data, referer=None):
+        return ""
+
+
+class SlowClient(FakeClient):
+    def get_text(self, url, referer=None):
+        if url != EPISODE_URL:
+            time.sleep(1)
+        return super().get_text(url, referer)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    store = StreamCache()
+    monkeypatch.setattr(resolve, "get_stream_cache", lambda: store)
+    monkeypatch.setattr(resolve.config, "PREFERRED_HOSTS", ["wibufile.com", "filedon.co"])
+    monkeypatch.setattr(resolve.config, "HLS_EXPAND", False)
+    return store
+
+
+def test_full_resolve_is_cached(cache):
+    result = resolve_links(FakeClient(), EPISODE_URL, workers=1)
+    assert len(result.options) == 2
+    assert len(cache.get(EPISODE_URL)) == 2
+
+
+def test_early_exit_is_cached_as_incomplete(cache):
+    result = resolve_links(FakeClient(), EPISODE_URL, workers=1, policy=POLICY)
+    assert [option.url for option in result.options] == ["https://wibufile.com/f/1080p.mp4"]
+    assert cache.get(EPISODE_URL) == result.options
+    assert cache.get(EPISODE_URL, complete_only=True) is None
+
+    assert resolve_links(FakeClient(), EPISODE_URL, policy=POLICY).options == result.options
+    assert len(resolve_links(FakeClient(), EPISODE_URL, workers=1).options) == 2
+    assert len(cache.get(EPISODE_URL, complete_only=True)) == 2
+
+
+def test_early_exit_stream_is_cached_as_incomplete(cache):
+    options = list(iter_video_links(FakeClient(), EPISODE_URL, workers=1, policy=POLICY))
+    assert len(options) == 1
+    assert cache.get(EPISODE_URL) == options
+    assert cache.get(EPISODE_URL, complete_only=True) is None
+    assert len(list(iter_video_links(FakeClient(), EPISODE_URL, workers=1))) == 2
+
+
+def test_early_exit_cancels_running_branches(cache, monkeypatch):
+    monkeypatch.setattr(resolve.config, "HLS_EXPAND", True)
+    monkeypatch.setitem(
+        PAGES, "https://filedon.co/e/2", '<video src="https://filedon.co/s/ep1.m3u8"></video>'
+    )
+    fetched = []
+    slow_started = threading.Event()
+
+    class TrackingClient(FakeClient):
+        def get_text(self, url, referer=None):
+            request_timeout()
+            if url == "https://filedon.co/e/2":
+                slow_started.set()
+                time.sleep(0.3)
+            elif url == "https://wibufile.com/embed/1":
+                slow_started.wait(1)
+            fetched.append(url)
+            return super().get_text(url, referer)
+
+    shared = threading.Event()
+    resolve_links(TrackingClient(), EPISODE_URL, workers=2, policy=POLICY, cancel=shared)
+    time.sleep(0.5)
+    assert not shared.is_set()
+    assert "https://filedon.co/e/2" in fetched
+    assert "https://filedon.co/s/ep1.m3u8" not in fetched
+
+
+def test_cancel_stops_running_resolve(cache):
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+    started = time.monotonic()
+    result = resolve_links(SlowClient(), EPISODE_URL, budget=30, workers=2, cancel=cancel)
+    assert time.monotonic() - started < 0.8
+    assert result.partial
+    assert cache.get(EPISODE_URL) is None
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_failing_branch_does_not_abort_resolve(cache, monkeypatch, workers):
+    def broken(client, candidate, referer):
+        raise RuntimeError("broken embed")
+
+    monkeypatch.setattr(resolve, "_resolve_embed", broken)
+    monkeypatch.setitem(PAGES, EPISODE_URL, '<iframe src="https://wibufile.com/embed/1">')
+    result = resolve_links(FakeClient(), EPISODE_URL, workers=workers)
+    assert result.options == []
@@ -0,0 +1,45 @@
+import pytest
+
+from bawang.models import SearchResult
+from bawang.scraper import search
+from bawang.scraper.search import search_anime
+from bawang.utils.catalog import Catalog
+
+ONE_PUNCH_MAN = SearchResult("One Punch Man", "https://v1.samehadaku.how/anime/one-punch-man/")
+ONE_PIECE = SearchResult("One Piece", "https://v1.samehadaku.how/anime/one-piece/")
+
+
+class FakeClient:
+    def __init__(self, results):
+        self.requests = []
+        self._results = results
+
+    def get_text(self, url, referer=None):
+        self.requests.append(url)
+        cards = "".join(
+            f'<div class="animepost"><a href="{result.url}" title="{result.title}"></a></div>'
+            for result in self._results
+        )
+        return f"<html><body>{cards}</body></html>"
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    store = Catalog()
+    store.upsert([ONE_PUNCH_MAN])
+    monkeypatch.setattr(search, "get_catalog", lambda: store)
+    return store
+
+
+def test_confident_catalog_hit_skips_network(catalog):
+    client = FakeClient([])
+    assert search_anime(client, "one punch man") == [ONE_PUNCH_MAN]
+    assert client.requests == []
+
+
+def test_near_miss_falls_through_to_live_search(catalog):
+    assert catalog.search("one piece") == [ONE_PUNCH_MAN]
+    client = FakeClient([ONE_PIECE])
+    assert search_anime(client, "one piece") == [ONE_PIECE, ONE_PUNCH_MAN]
+    assert len(client.requests) == 1
+    assert catalog.search("one piece", confident_only=True) == [ONE_PIECE]
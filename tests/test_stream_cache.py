@@ -0,0 +1,52 @@
+import time
+
+from bawang import config
+from bawang.models import QualityOption
+from bawang.resolver.cache import StreamCache, expiry_for
+
+NOW = 1_000_000.0
+EPISODE_URL = "https://v1.samehadaku.how/frieren-episode-1/"
+
+
+def _option(url: str) -> QualityOption:
+    return QualityOption(label="720p", url=url)
+
+
+def test_expiry_defaults_without_url_hint():
+    assert expiry_for([_option("https://a.example/v.mp4")], now=NOW) == (
+        NOW + config.STREAM_CACHE_DEFAULT_TTL
+    )
+
+
+def test_expiry_uses_earliest_url_hint_minus_margin():
+    options = [
+        _option(f"https://a.example/v.mp4?expire={int(NOW) + 3600}"),
+        _option(f"https://b.example/v.mp4?exp={int(NOW) + 1800}&sig=x"),
+    ]
+    assert expiry_for(options, now=NOW) == NOW + 1800 - config.STREAM_CACHE_EXPIRY_MARGIN
+
+
+def test_expiry_is_clamped_to_max_ttl():
+    options = [_option(f"https://a.example/v.mp4?expires={int(NOW) + 7 * 24 * 3600}")]
+    assert expiry_for(options, now=NOW) == NOW + config.STREAM_CACHE_MAX_TTL
+
+
+def test_links_close_to_expiry_are_not_cached():
+    expires = int(time.time()) + config.STREAM_CACHE_EXPIRY_MARGIN - 1
+    store = StreamCache()
+    store.put(EPISODE_URL, [_option(f"https://a.example/v.mp4?expire={expires}")])
+    assert store.get(EPISODE_URL) is None
+
+
+def test_disk_round_trip_keeps_complete_flag(tmp_path):
+    path = str(tmp_path / "streams.sqlite3")
+    options = [_option("https://a.example/v.mp4")]
+    store = StreamCache(path)
+    store.put(EPISODE_URL, options, complete=False)
+    store.close()
+
+    reopened = StreamCache(path)
+    assert reopened.get(EPISODE_URL, complete_only=True) is None
+    assert reopened.get(EPISODE_URL) == options
+    reopened.discard(EPISODE_URL)
+    assert reopened.get(EPISODE_URL) is None